@@ -0,0 +1,87 @@
+import json
+import logging
+import threading
+import time
+from websockets.sync.client import connect
+
+logger = logging.getLogger(__name__)
+
+BINANCE_STREAM_URL = "wss://stream.binance.com:9443/stream"
+
+class BinanceTickerStream:
+    def __init__(self, max_age: float = 5.0, reconnect_delay: float = 5.0):
+        """
+        Keeps the latest Binance tickers of the watched symbols in memory through one combined
+        <symbol>@ticker WebSocket stream, so a cycle reads prices from memory instead of REST.
+
+        Args:
+            max_age (float): Seconds after which a ticker is considered stale.
+            reconnect_delay (float): Seconds to wait before reconnecting after the stream fails.
+        """
+        self.max_age = max_age
+        self.reconnect_delay = reconnect_delay
+        self._market_ids = {} # Binance market id (e.g. 'ETHUSDT') -> ccxt symbol (e.g. 'ETH/USDT')
+        self._tickers = {}    # ccxt symbol -> {'bid', 'ask', 'last', 'received_at'}
+        self._lock = threading.Lock()
+        self._symbols_changed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="binance-tickers", daemon=True)
+
+    def start(self):
+        """Starts the stream thread. The stream reconnects on its own for the lifetime of the process."""
+        self._thread.start()
+        return self
+
+    def watch(self, market_ids: dict):
+        """
+        Sets the symbols to stream. The stream is reopened only if the set of symbols changed.
+
+        Args:
+            market_ids (dict): Binance market id -> ccxt symbol, e.g. {'ETHUSDT': 'ETH/USDT'}.
+        """
+        with self._lock:
+            if market_ids == self._market_ids:
+                return
+            self._market_ids = dict(market_ids)
+        self._symbols_changed.set()
+
+    def get_tickers(self, symbols) -> dict:
+        """
+        Returns the streamed tickers of symbols in the format of ccxt's fetch_tickers,
+        or None if any of them is missing or stale (the caller should fall back to REST).
+        """
+        now = time.monotonic()
+        with self._lock:
+            tickers = {symbol: self._tickers.get(symbol) for symbol in symbols}
+        if any(ticker is None or now - ticker['received_at'] > self.max_age for ticker in tickers.values()):
+            return None
+        return tickers
+
+    def _run(self):
+        while True:
+            self._symbols_changed.wait()
+            self._symbols_changed.clear()
+            with self._lock:
+                market_ids = dict(self._market_ids)
+            streams = "/".join(f"{market_id.lower()}@ticker" for market_id in market_ids)
+            try:
+                with connect(f"{BINANCE_STREAM_URL}?streams={streams}", max_size=None) as ws:
+                    logger.info(f"BinanceTickerStream: Streaming {len(market_ids)} tickers")
+                    while not self._symbols_changed.is_set():
+                        try:
+                            message = json.loads(ws.recv(timeout=1))
+                        except TimeoutError:
+                            continue
+                        data = message.get('data', {})
+                        symbol = market_ids.get(data.get('s'))
+                        if symbol is None:
+                            continue
+                        ticker = {
+                            'bid': float(data['b']), 'ask': float(data['a']), 'last': float(data['c']),
+                            'received_at': time.monotonic()
+                        }
+                        with self._lock:
+                            self._tickers[symbol] = ticker
+            except Exception as e:
+                logger.warning(f"BinanceTickerStream: Stream failed: {e}. Reconnecting in {self.reconnect_delay}s.")
+                time.sleep(self.reconnect_delay)
+                self._symbols_changed.set()
@@ -2,31 +2,63 @@ import logging
 import os 
 import time
 import ccxt
+import requests
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import threading
 import random
+import atexit
+import sys
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from collections import deque
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from web3 import Web3
-from decimal import Decimal, getcontext
-from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from config import config, load_abis
-from uniswap_pool_helper import UniswapPoolHelper, Token
+from uniswap_pool_helper import UniswapPoolHelper, get_contract, get_token, get_cached_token, get_cached_gas_price
+from multicall_helper import Multicall
+from block_watcher import BlockWatcher
+from binance_ticker_stream import BinanceTickerStream
 from telegram_utils import send_telegram_message
 from arbitrage_executor import execute_arbitrage_trade
 
 # ---- Setup logging ----
+LOG_MAX_BYTES = 50 * 1024 * 1024 # Size at which a log file is rotated
+LOG_BACKUP_COUNT = 5 # Rotated log files kept per log
+
+def start_queue_listener(*handlers):
+    """
+    Returns a QueueHandler whose records are written to handlers by a background QueueListener,
+    so logging calls never wait on file or console I/O. The listener is flushed and stopped at exit.
+    """
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue)
+
 def setup_logging():
-    """Configures logging for the application."""
+    """Configures logging for the application. Calling it again does not add duplicate handlers."""
+    if logging.getLogger().handlers:
+        return
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.FileHandler("arbitrage_bot.log", mode='a'),
-            logging.StreamHandler()
+            start_queue_listener(
+                RotatingFileHandler("arbitrage_bot.log", mode='a', maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT),
+                logging.StreamHandler()
+            )
         ]
     )
     # Configure the trade executor logger separately
-    trade_log_handler = logging.FileHandler("trades.log", mode='a')
+    trade_log_handler = start_queue_listener(logging.FileHandler("trades.log", mode='a'))
     trade_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     trade_log_handler.setFormatter(trade_log_formatter)
 
@@ -37,193 +69,680 @@ def setup_logging():
 
 # ---- Constants ----
 CSV_INPUT = "arbitrage_pairs.csv"
-STABLECOINS_USD = ['USDT', 'USDC', 'BUSD', 'TUSD', 'DAI', 'USDP', 'FDUSD', 'USDD']
+STABLECOINS_USD = ['USDT', 'USDC', 'BUSD', 'TUSD', 'DAI', 'USDP', 'FDUSD', 'USDD'] # In order of preference
+STABLECOINS_USD_SET = frozenset(STABLECOINS_USD) # For O(1) membership tests
+DIRECTIONS = ("Buy on Binance, Sell on Uniswap", "Buy on Uniswap, Sell on Binance")
+SKIPPED_DECISION = "Skipped: mid spread below fees"
+DIRECTION_COLUMNS = (
+    "decision", "binance_actual_price", "uniswap_actual_price", "amount_in_quote", "amount_out_quote",
+    "uniswap_new_price", "gas_fee_eth", "gas_fee_quote", "profit", "margin", "profit_stablecoin"
+)
+CYCLE_SLEEP = 10.0 # Pause between cycles in seconds when the best margin is MARGIN_GAP_SCALE below the threshold
+MIN_CYCLE_SLEEP, MAX_CYCLE_SLEEP = 1.0, 30.0 # Bounds of the adaptive pause
+MARGIN_GAP_SCALE = 0.005 # 0.5%
+MARGIN_HISTORY_CYCLES = 5 # Number of recent cycles whose best margin drives the pause
 MAX_WORKERS = 10 # Maximum number of concurrent trades
+RPC_TIMEOUT = 10 # Seconds before an Ethereum RPC request is abandoned (web3's default is 30)
+MARKETS_RELOAD_INTERVAL = 3600 # Seconds between reloads of the Binance markets manifest
+RPC_WORKERS = 16 # Maximum number of concurrent RPC requests (pool initializations and Multicall3 requests)
+MULTICALL_BATCH_SIZE = 60 # Calls per Multicall3 request (3 per pair), keeps each eth_call under the RPC gas cap
+RESERVES_TTL = 300 # Seconds before a pool's reserves (TVL filter) are read again
+# Error messages of nodes asked for a block they do not have, e.g. a pushed head a load-balanced node lags behind
+UNKNOWN_BLOCK_ERRORS = ("header not found", "unknown block", "block not found")
 
 # ---- Concurrency and State Management ----
 trade_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+# Shared by every cycle so worker threads are created once per run, not once per cycle
+rpc_executor = ThreadPoolExecutor(max_workers=RPC_WORKERS, thread_name_prefix='arb')
 active_trades = set()
 active_trades_lock = threading.Lock()
 
-getcontext().prec = 30 # Set decimal precision for calculations
+# Pool helpers keyed by pool id. Token addresses, decimals and fee are immutable,
+# so each pool is read from the chain once per run instead of once per cycle.
+_POOL_CACHE = {}
+_markets_loaded_at = 0.0
+_market_symbols = frozenset() # Symbols of the loaded Binance markets, rebuilt only on reload
+_results_files = {} # CSV path -> file handle kept open for the whole run
+_sepolia_pool = None # Test pool for trade execution, created on the first opportunity
 
 # ---- Helper Functions ----
-def get_binance_mid_price(exchange, pair):
-    """Fetches and calculates the mid-price from Binance."""
-    try:
-        ticker = exchange.fetch_ticker(pair)
-        if 'ask' in ticker and 'bid' in ticker:
-            return (Decimal(str(ticker['ask'])) + Decimal(str(ticker['bid']))) / Decimal(2)
-        logging.warning(f"Ask/bid prices missing for {pair}. Mid price cannot be calculated.")
-        return Decimal(0)
-    except Exception as e:
-        logging.warning(f"Cannot fetch Binance mid price for {pair}: {e}")
-        return Decimal(0)
+def create_binance_exchange():
+    """Creates a Binance client whose REST calls share one pooled keep-alive HTTP session."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return ccxt.binance({"session": session})
+
+def create_web3():
+    """
+    Creates the Ethereum RPC client. Its connection pool is as large as the number of
+    concurrent workers, so parallel pair evaluations never wait for or discard connections.
+    The chain id never changes, so it is cached by the provider and queried once per run.
+    """
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RPC_WORKERS)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    provider = Web3.HTTPProvider(
+        config.ETHEREUM_RPC_URL, session=session, request_kwargs={"timeout": RPC_TIMEOUT},
+        # web3_clientVersion stays uncached so is_connected() keeps probing the node
+        cache_allowed_requests=True, cacheable_requests={"eth_chainId", "net_version"},
+        request_cache_validation_threshold=None
+    )
+    return Web3(provider)
+
+@lru_cache(maxsize=1)
+def _read_pairs(csv_path, mtime):
+    pairs_df = pd.read_csv(csv_path)
+    if not pairs_df.empty:
+        # Per-pair constants are derived once per load with vectorized ops instead of once per row
+        pairs_df[["base_symbol", "quote_symbol"]] = pairs_df["binance_pair"].str.upper().str.split('/', expand=True)
+        pairs_df["reverse_price"] = pairs_df["reverse_price"].astype(bool)
+    # Rows are materialized once per load; interned symbols make ticker and market lookups identity hits
+    pair_rows = tuple(
+        row._replace(
+            binance_pair=sys.intern(row.binance_pair),
+            base_symbol=sys.intern(row.base_symbol),
+            quote_symbol=sys.intern(row.quote_symbol)
+        )
+        for row in pairs_df.itertuples(index=False)
+    )
+    return pairs_df, pair_rows
+
+def load_pairs(csv_path):
+    """
+    Returns (pairs_df, pair_rows) of csv_path, parsed again only when the file has been modified.
+    pair_rows holds one namedtuple per CSV row. Do not mutate the results.
+    """
+    return _read_pairs(csv_path, os.path.getmtime(csv_path))
+
+def refresh_markets(exchange):
+    """
+    Loads the Binance markets manifest (several MB) on the first call and reloads it at most
+    once per MARKETS_RELOAD_INTERVAL; in between, ccxt serves the markets from memory.
+    Returns the frozenset of market symbols, the same object until the next reload.
+    """
+    global _markets_loaded_at, _market_symbols
+    if time.time() - _markets_loaded_at > MARKETS_RELOAD_INTERVAL:
+        exchange.load_markets(reload=True)
+        _markets_loaded_at = time.time()
+        _market_symbols = frozenset(exchange.markets)
+    return _market_symbols
+
+# Prices in the screening path are plain floats: results are written as floats anyway,
+# and Decimal is only needed where exact token amounts are computed (quotes and trades).
+def get_binance_mid_price(tickers, pair):
+    """Calculates the mid-price from a batched Binance tickers snapshot."""
+    ticker = tickers.get(pair)
+    if ticker and ticker.get('ask') and ticker.get('bid'):
+        return (ticker['ask'] + ticker['bid']) / 2
+    logging.warning(f"Ask/bid prices missing for {pair}. Mid price cannot be calculated.")
+    return 0.0
     
-def get_uniswap_mid_price(pool, reverse_price):
-    """Fetches the mid-price from a Uniswap pool."""
-    try:
-        return pool.get_current_price(reverse_price)
-    except Exception as e:
-        logging.warning(f"Cannot fetch Uniswap mid price: {e}. Returning 0.")
-        return Decimal(0)
-
-def get_eth_price_in_currency(exchange, currency_symbol="USDT"):
-    """Fetches the price of ETH in a given currency, using USDT as a bridge if needed."""
-    if currency_symbol.upper() in ["ETH", "WETH"]:
-        return Decimal(1)
-    try:
-        # Attempt direct conversion
-        return Decimal(str(exchange.fetch_ticker(f"ETH/{currency_symbol.upper()}")['last']))
-    except (ccxt.Error, KeyError):
-        try:
-            # Attempt conversion via USDT
-            eth_usdt_price = Decimal(str(exchange.fetch_ticker("ETH/USDT")['last']))
-            currency_usdt_price = Decimal(str(exchange.fetch_ticker(f"{currency_symbol.upper()}/USDT")['last']))
-            return eth_usdt_price / currency_usdt_price if currency_usdt_price else Decimal(0)
-        except (ccxt.Error, KeyError) as e:
-            logging.warning(f"Could not determine ETH price in {currency_symbol}: {e}")
-            return Decimal(0)
-
-def get_base_price_in_stablecoin(exchange, base_symbol, quote_symbol, binance_mid_price):
+def get_eth_price_in_currency(tickers, currency_symbol="USDT"):
+    """Looks up the price of ETH in a given currency, using USDT as a bridge if needed."""
+    currency_symbol = currency_symbol.upper()
+    if currency_symbol in ["ETH", "WETH"]:
+        return 1.0
+    # Attempt direct conversion
+    direct_ticker = tickers.get(f"ETH/{currency_symbol}")
+    if direct_ticker and direct_ticker.get('last'):
+        return direct_ticker['last']
+    # Attempt conversion via USDT
+    eth_usdt_ticker = tickers.get("ETH/USDT")
+    currency_usdt_ticker = tickers.get(f"{currency_symbol}/USDT")
+    if eth_usdt_ticker and currency_usdt_ticker and eth_usdt_ticker.get('last') and currency_usdt_ticker.get('last'):
+        return eth_usdt_ticker['last'] / currency_usdt_ticker['last']
+    logging.warning(f"Could not determine ETH price in {currency_symbol}.")
+    return 0.0
+
+def get_base_price_in_stablecoin(tickers, base_symbol, quote_symbol, binance_mid_price):
     """Determines the price of the base asset in a stablecoin to calculate trade size."""
-    if quote_symbol in STABLECOINS_USD and binance_mid_price > 0:
+    if quote_symbol in STABLECOINS_USD_SET and binance_mid_price > 0:
         return binance_mid_price, quote_symbol
-    if base_symbol in STABLECOINS_USD:
-        return Decimal(1), base_symbol
+    if base_symbol in STABLECOINS_USD_SET:
+        return 1.0, base_symbol
     
     # Find price against any available stablecoin
     for stable in STABLECOINS_USD:
+        ticker = tickers.get(f"{base_symbol}/{stable}")
+        if ticker and ticker.get('last'):
+            return ticker['last'], stable
+    return 0.0, None
+
+@lru_cache(maxsize=8)
+def get_conversion_symbols(markets, binance_pairs):
+    """
+    Returns the Binance symbols needed to convert gas fees (ETH -> quote currency) and
+    trade sizes (base asset -> stablecoin) for the given pairs, so that they can be
+    fetched together with the pairs in one batched request per cycle.
+    Memoized: markets (a frozenset) and binance_pairs (a tuple) only change on a markets reload or CSV edit.
+    """
+    symbols = set()
+    for binance_pair in binance_pairs:
+        base_symbol, quote_symbol = binance_pair.upper().split('/')
+
+        if quote_symbol not in ["ETH", "WETH"]:
+            if f"ETH/{quote_symbol}" in markets:
+                symbols.add(f"ETH/{quote_symbol}")
+            elif f"{quote_symbol}/USDT" in markets and "ETH/USDT" in markets:
+                symbols.update(["ETH/USDT", f"{quote_symbol}/USDT"])
+
+        if quote_symbol not in STABLECOINS_USD_SET and base_symbol not in STABLECOINS_USD_SET:
+            for stable in STABLECOINS_USD:
+                if f"{base_symbol}/{stable}" in markets:
+                    symbols.add(f"{base_symbol}/{stable}")
+                    break
+    return frozenset(symbols)
+
+def get_pool_helper(w3, pool_id, abis):
+    """Returns the cached UniswapPoolHelper for pool_id, creating it on first use."""
+    pool = _POOL_CACHE.get(pool_id)
+    if pool is None:
+        pool = _POOL_CACHE.setdefault(pool_id, UniswapPoolHelper(w3, pool_id, abis))
+    return pool
+
+def warm_pool_cache(w3, multicall, pool_ids, abis):
+    """
+    Initializes the helpers of all pools not cached yet. Their tokens, fees, decimals and symbols
+    are read in two Multicall3 rounds; pools that cannot be read that way (e.g. a token with a
+    non-standard symbol()) fall back to individual reads, in parallel.
+    """
+    missing = [pool_id for pool_id in set(pool_ids) if pool_id not in _POOL_CACHE]
+    if not missing:
+        return
+
+    try:
+        pool_contracts = {
+            pool_id: get_contract(w3, Web3.to_checksum_address(pool_id), abis['POOL'])
+            for pool_id in missing
+        }
+        pool_calls = [
+            call() for contract in pool_contracts.values()
+            for call in (contract.functions.token0, contract.functions.token1, contract.functions.fee)
+        ]
+        pool_results = aggregate_in_chunks(multicall, pool_calls)
+        pool_immutables = {}
+        for i, pool_id in enumerate(pool_contracts):
+            (token0_ok, token0), (token1_ok, token1), (fee_ok, fee) = pool_results[3 * i:3 * i + 3]
+            if token0_ok and token1_ok and fee_ok:
+                pool_immutables[pool_id] = (token0[0], token1[0], fee[0])
+
+        # Tokens shared with already cached pools (e.g. WETH, USDC) are not read again
+        tokens = {}
+        token_contracts = {}
+        for immutables in pool_immutables.values():
+            for address in immutables[:2]:
+                token = get_cached_token(w3, address)
+                if token is not None:
+                    tokens[address] = token
+                elif address not in token_contracts:
+                    token_contracts[address] = get_contract(w3, address, abis['ERC20'])
+        token_calls = [
+            call() for contract in token_contracts.values()
+            for call in (contract.functions.decimals, contract.functions.symbol)
+        ]
+        token_results = aggregate_in_chunks(multicall, token_calls)
+        for i, address in enumerate(token_contracts):
+            (decimals_ok, decimals), (symbol_ok, symbol) = token_results[2 * i:2 * i + 2]
+            if decimals_ok and symbol_ok:
+                tokens[address] = get_token(w3, address, abis['ERC20'], decimals=decimals[0], symbol=symbol[0])
+
+        for pool_id, (token0, token1, fee) in pool_immutables.items():
+            if token0 in tokens and token1 in tokens:
+                _POOL_CACHE[pool_id] = UniswapPoolHelper(w3, pool_id, abis, token0=tokens[token0], token1=tokens[token1], fee=fee)
+    except Exception as e:
+        logging.warning(f"Batched pool initialization failed: {e}. Reading pools individually.")
+
+    # Pools not created above are read individually
+    futures = {rpc_executor.submit(get_pool_helper, w3, pool_id, abis): pool_id for pool_id in missing}
+    for future in as_completed(futures):
         try:
-            ticker = exchange.fetch_ticker(f"{base_symbol}/{stable}")
-            if 'last' in ticker:
-                return Decimal(str(ticker['last'])), stable
-        except (ccxt.Error, KeyError):
-            continue
-    return Decimal(0), None
+            future.result()
+        except Exception as e:
+            logging.warning(f"Could not initialize pool {futures[future]}: {e}")
+
+def refresh_pool_reserves(multicall, pool_ids):
+    """
+    Reads the reserves of the cached pools whose reserves are missing or older than RESERVES_TTL,
+    all balanceOf calls in one Multicall3 round. A pool drained mid-run is filtered out, and a pool
+    skipped earlier is admitted again, within RESERVES_TTL.
+    """
+    now = time.monotonic()
+    pools = []
+    for pool_id in set(pool_ids):
+        pool = _POOL_CACHE.get(pool_id)
+        if pool is not None and (pool.reserves_read_at is None or now - pool.reserves_read_at > RESERVES_TTL):
+            pools.append(pool)
+    if not pools:
+        return
+
+    reserve_results = aggregate_in_chunks(multicall, [call for pool in pools for call in pool.get_reserve_calls()])
+    for i, pool in enumerate(pools):
+        (balance0_ok, balance0), (balance1_ok, balance1) = reserve_results[2 * i:2 * i + 2]
+        if balance0_ok and balance1_ok:
+            pool.update_reserves(balance0[0], balance1[0])
+        else:
+            logging.warning(f"Could not read the reserves of pool {pool.pool_address_cs}. Retrying next cycle.")
 
 def get_sepolia_pool(abis):
-    """Returns a Uniswap V3 pool instance for the Sepolia testnet for testing."""
-    pool_address = "0x3289680dD4d6C10bb19b899729cda5eEF58AEfF1" # WETH/USDC 0.05% on Sepolia
-    w3_sepolia = Web3(Web3.HTTPProvider("https://eth-sepolia.public.blastapi.io"))
-    return UniswapPoolHelper(w3=w3_sepolia, pool_address=pool_address, abis=abis)
+    """
+    Returns a Uniswap V3 pool instance for the Sepolia testnet for testing.
+    Created on the first trade and reused, so its tokens, fee and chain id are read once per run.
+    """
+    global _sepolia_pool
+    if _sepolia_pool is None:
+        pool_address = "0x3289680dD4d6C10bb19b899729cda5eEF58AEfF1" # WETH/USDC 0.05% on Sepolia
+        w3_sepolia = Web3(Web3.HTTPProvider("https://eth-sepolia.public.blastapi.io"))
+        _sepolia_pool = UniswapPoolHelper(w3=w3_sepolia, pool_address=pool_address, abis=abis)
+    return _sepolia_pool
+
+def prepare_pair(index, total_pairs, row, w3, abis, tickers, eth_prices, trade_amount_usd):
+    """
+    Gathers the Binance market data of one CSV pair and builds its (unexecuted) Uniswap calls.
+    Returns None if the pair cannot be evaluated in this cycle.
+    """
+    binance_pair = row.binance_pair
+    uniswap_pool_id = row.uniswap_pool_id
+    # reverse_price: False -> Binance price: QUOTE/BASE, Uniswap pool's price: token1/token0 (token0=BASE, token1=QUOTE)
+    #                True  -> Binance price: QUOTE/BASE, Uniswap reversed price: token0/token1 (token0=QUOTE, token1=BASE)
+    reverse_price_on_uniswap = row.reverse_price
+    base_symbol, quote_symbol = row.base_symbol, row.quote_symbol
+
+    logging.info("(%d/%d) Processing: %s, Uniswap pool: %s", index + 1, total_pairs, binance_pair, uniswap_pool_id)
+
+    try:
+        uniswap_pool = get_pool_helper(w3, uniswap_pool_id, abis)
+        uniswap_base_token = uniswap_pool.token0 if not reverse_price_on_uniswap else uniswap_pool.token1
+
+        binance_mid_price = get_binance_mid_price(tickers, binance_pair)
+        if binance_mid_price <= 0:
+            # Ask or bid is missing (already logged); without both the directions cannot be evaluated
+            return None
+        base_stablecoin_price, stablecoin_symbol = get_base_price_in_stablecoin(tickers, base_symbol, quote_symbol, binance_mid_price)
+
+        if not base_stablecoin_price:
+            logging.warning(f"Could not find stablecoin price for {base_symbol}. Skipping.")
+            return None
+
+        if config.MIN_POOL_TVL_USD > 0:
+            # Value both reserves in stablecoin: base at base_stablecoin_price, quote via the Binance mid price
+            if uniswap_pool.reserves is None:
+                logging.warning(f"Pool reserves of {binance_pair} are unknown. Skipping.")
+                return None
+            reserve0, reserve1 = uniswap_pool.reserves
+            reserve_base, reserve_quote = (reserve0, reserve1) if not reverse_price_on_uniswap else (reserve1, reserve0)
+            pool_tvl = (float(reserve_base) + float(reserve_quote) / binance_mid_price) * base_stablecoin_price
+            if pool_tvl < config.MIN_POOL_TVL_USD:
+                logging.info(f"Pool TVL of {binance_pair} is ${pool_tvl:,.0f}, below MIN_POOL_TVL_USD. Skipping.")
+                return None
+
+        trade_amount_base = trade_amount_usd / base_stablecoin_price
+        # Quotes need an exact Decimal amount to derive the token's base units.
+        quote_amount = Decimal(trade_amount_base)
+
+        ticker = tickers[binance_pair]
+        binance_ask, binance_bid = ticker['ask'], ticker['bid']
+
+        base_result_data = {
+            "blocknumber": None, # Set once the Uniswap calls have been executed
+            "timestamp": int(time.time()),
+            "binance_pair": binance_pair,
+            "uniswap_pair": row.uniswap_pair,
+            "uniswap_pool_id": uniswap_pool_id,
+            "reverse_price": int(reverse_price_on_uniswap),
+            "base_symbol": base_symbol, "quote_symbol": quote_symbol,
+            "uniswap_fee": float(uniswap_pool.fee) / 1e6,
+            "binance_fee": config.BINANCE_FEE,
+            "binance_mid_price": binance_mid_price,
+            "uniswap_mid_price": None, # Set once the Uniswap calls have been executed
+            "trade_amount_base": trade_amount_base,
+            "base_stablecoin_price": base_stablecoin_price,
+            "stablecoin_symbol": stablecoin_symbol
+        }
+
+        return {
+            "result": base_result_data,
+            "pool": uniswap_pool,
+            "token": uniswap_base_token,
+            "amount": quote_amount,
+            "calls": uniswap_pool.get_quote_calls(uniswap_base_token, quote_amount),
+            "binance_ask": binance_ask,
+            "binance_bid": binance_bid,
+            "eth_price_in_quote": eth_prices[quote_symbol],
+        }
+
+    except Exception as e:
+        logging.error(f"Failed processing {binance_pair}: {e}", exc_info=False)
+        return None
+
+def is_unknown_block_error(error) -> bool:
+    """True if the RPC node rejected a request because it does not know the requested block (yet)."""
+    message = str(error).lower()
+    return any(marker in message for marker in UNKNOWN_BLOCK_ERRORS)
+
+def aggregate_calls(multicall, calls, block_identifier):
+    """
+    Executes one chunk of calls through Multicall3, marking every call as failed if the request fails.
+    An unknown-block error is raised instead, so the caller can move the whole round to another block.
+    """
+    try:
+        return multicall.aggregate(calls, block_identifier=block_identifier)
+    except Exception as e:
+        if block_identifier != 'latest' and is_unknown_block_error(e):
+            raise
+        logging.warning(f"Multicall round of {len(calls)} calls at block {block_identifier} failed: {e}")
+        return [(False, None)] * len(calls)
+
+def aggregate_in_chunks(multicall, calls, block_identifier='latest'):
+    """
+    Executes calls through Multicall3 in chunks of MULTICALL_BATCH_SIZE calls sent concurrently.
+    Returns one (success, result) tuple per call, in the order of calls.
+    """
+    futures = [
+        rpc_executor.submit(aggregate_calls, multicall, calls[i:i + MULTICALL_BATCH_SIZE], block_identifier)
+        for i in range(0, len(calls), MULTICALL_BATCH_SIZE)
+    ]
+    return [call_result for future in futures for call_result in future.result()]
+
+# ---- Per-block pool state ----
+# Pool state only changes between blocks, so slot0 and liquidity read at a block are reused by
+# the pruning, local quoting and quoter rounds of the same cycle, and by later cycles while the
+# block is unchanged.
+_block_state = {"block": None, "results": {}} # (pool address, function name) -> (success, result)
+
+def aggregate_pool_state(multicall, calls, block_number):
+    """
+    Like aggregate_in_chunks, but argument-less pool state calls (slot0, liquidity) already read
+    successfully at block_number are not sent again. Calls with arguments (quotes) are always sent.
+    Only results of requests pinned to block_number are cached: aggregate_calls never substitutes
+    another block, and a round at 'latest' bypasses the cache.
+    """
+    if not isinstance(block_number, int):
+        return aggregate_in_chunks(multicall, calls, block_number)
+    if _block_state["block"] != block_number:
+        _block_state["block"], _block_state["results"] = block_number, {}
+    cached = _block_state["results"]
+    keys = [None if call.args or call.kwargs else (call.address, call.fn_name) for call in calls]
+    results = [cached.get(key) for key in keys]
+    missing = [i for i, call_result in enumerate(results) if call_result is None]
+    fetched = aggregate_in_chunks(multicall, [calls[i] for i in missing], block_number)
+    for i, call_result in zip(missing, fetched):
+        results[i] = call_result
+        if call_result[0] and keys[i] is not None:
+            cached[keys[i]] = call_result
+    return results
+
+def prune_by_mid_spread(multicall, prepared_pairs, block_number):
+    """
+    Reads the slot0 of all prepared pairs in one Multicall3 round and separates the pairs whose
+    Binance/Uniswap mid-price spread cannot cover the fees and PROFIT_THRESHOLD. Price impact and
+    the bid/ask spread only lower the margin further, so no quote of those pairs can pass.
+    Returns (pairs_to_quote, skipped_results).
+    """
+    slot0_results = aggregate_pool_state(multicall, [pair["calls"][0] for pair in prepared_pairs], block_number)
+    pairs_to_quote, skipped_results = [], []
+    for pair, (success, slot0) in zip(prepared_pairs, slot0_results):
+        result = pair["result"]
+        if not success:
+            logging.error(f"Failed processing {result['binance_pair']}: Uniswap call reverted at block {block_number}")
+            continue
+        uniswap_mid_price = float(pair["pool"].price_from_slot0(slot0, bool(result["reverse_price"])))
+        binance_mid_price = result["binance_mid_price"]
+        fee_floor = result["uniswap_fee"] + config.BINANCE_FEE + config.PROFIT_THRESHOLD
+        if binance_mid_price > 0 and abs(binance_mid_price - uniswap_mid_price) / binance_mid_price < fee_floor:
+            # The pair is dropped from this cycle, so its result data is completed in place
+            result["blocknumber"], result["uniswap_mid_price"] = block_number, uniswap_mid_price
+            skipped_results.append(result)
+        else:
+            pairs_to_quote.append(pair)
+    return pairs_to_quote, skipped_results
+
+def quote_pairs_locally(multicall, prepared_pairs, block_number):
+    """
+    Reads the slot0 and liquidity of all prepared pairs in one Multicall3 round and computes
+    their quotes with the pool's local swap math instead of the quoter.
+    Returns one list of raw [slot0, sell, buy] results per pair, or None for the pairs that need the quoter.
+    """
+    state_calls = [call for pair in prepared_pairs for call in pair["pool"].get_state_calls()]
+    state_results = aggregate_pool_state(multicall, state_calls, block_number)
+    local_results = []
+    for i, pair in enumerate(prepared_pairs):
+        (slot0_ok, slot0), (liquidity_ok, liquidity) = state_results[2 * i:2 * i + 2]
+        raw_results = None
+        if slot0_ok and liquidity_ok:
+            try:
+                raw_results = pair["pool"].local_quote_results(pair["token"], pair["amount"], [slot0, liquidity])
+            except Exception as e:
+                logging.warning(f"Local quote of {pair['result']['binance_pair']} failed: {e}. Using the quoter.")
+        local_results.append(raw_results)
+    return local_results
+
+def fetch_uniswap_quotes(w3, multicall, prepared_pairs, block_watcher=None):
+    """
+    Executes the slot0 and quote calls of all prepared pairs through Multicall3,
+    all pinned to the same block.
+    Pairs with a failed call are skipped; a failing pool never aborts the others.
+    The block number comes from block_watcher's newHeads feed when it is available. If the
+    RPC node does not know that block yet, the whole cycle is read again at the node's own block.
+    With SKIP_QUOTES_BELOW_FEES, only pairs that pass prune_by_mid_spread are quoted.
+    With LOCAL_QUOTES, pairs whose swaps stay within the active tick range are quoted
+    locally and only the others are sent to the quoter.
+    Returns (pair_quotes, skipped_results): the completed pair quotes in the order of
+    prepared_pairs, and the result data of the pairs pruned without quoting.
+    """
+    # Block number and gas price are shared by all pairs, so they are read once per cycle
+    block_number = block_watcher.get_latest_block() if block_watcher else None
+    if block_number is not None:
+        gas_price_wei = get_cached_gas_price(w3)
+    else:
+        with w3.batch_requests() as batch:
+            batch.add(w3.eth.get_block_number())
+            batch.add(w3.eth.gas_price)
+            block_number, gas_price_wei = batch.execute()
+
+    try:
+        return quote_pairs_at_block(multicall, prepared_pairs, block_number, gas_price_wei)
+    except Exception as e:
+        if not is_unknown_block_error(e):
+            raise
+        logging.warning(f"Block {block_number} is unknown to the RPC node: {e}. Re-reading the block number.")
+    # Read once for the whole cycle, so every round and every recorded result still share one block
+    block_number = w3.eth.get_block_number()
+    return quote_pairs_at_block(multicall, prepared_pairs, block_number, gas_price_wei)
+
+def quote_pairs_at_block(multicall, prepared_pairs, block_number, gas_price_wei):
+    """Runs the pruning, local quoting and quoter rounds of fetch_uniswap_quotes, all at block_number."""
+    skipped_results = []
+    if config.SKIP_QUOTES_BELOW_FEES:
+        prepared_pairs, skipped_results = prune_by_mid_spread(multicall, prepared_pairs, block_number)
+
+    if config.LOCAL_QUOTES:
+        raw_results = quote_pairs_locally(multicall, prepared_pairs, block_number)
+        logging.info(f"Quoted {sum(r is not None for r in raw_results)}/{len(prepared_pairs)} pairs locally")
+    else:
+        raw_results = [None] * len(prepared_pairs)
+
+    quoter_indices = [i for i, pair_results in enumerate(raw_results) if pair_results is None]
+    calls = [call for i in quoter_indices for call in prepared_pairs[i]["calls"]]
+    # slot0 already read by pruning or local quoting is reused, so only the quote calls are sent
+    call_results = aggregate_pool_state(multicall, calls, block_number)
+
+    offset = 0
+    for i in quoter_indices:
+        pair = prepared_pairs[i]
+        pair_results = call_results[offset:offset + len(pair["calls"])]
+        offset += len(pair["calls"])
+        if not all(success for success, _ in pair_results):
+            logging.error(f"Failed processing {pair['result']['binance_pair']}: Uniswap call reverted at block {block_number}")
+            continue
+        raw_results[i] = [result for _, result in pair_results]
 
-def run_arbitrage_cycle(trade_amount_usd, csv_output):
-    """Main arbitrage cycle to find and evaluate opportunities."""
+    pair_quotes = []
+    for pair, pair_results in zip(prepared_pairs, raw_results):
+        if pair_results is None:
+            continue
+        binance_pair = pair["result"]["binance_pair"]
+        try:
+            uniswap_mid_price, sell_quote, buy_quote = pair["pool"].parse_quote_results(
+                pair["token"], pair["amount"], pair_results,
+                gas_price_wei, bool(pair["result"]["reverse_price"])
+            )
+        except Exception as e:
+            logging.error(f"Failed processing {binance_pair}: {e}", exc_info=False)
+            continue
+
+        pair["result"]["blocknumber"] = block_number
+        pair["result"]["uniswap_mid_price"] = float(uniswap_mid_price)
+        pair["sell_quote"], pair["buy_quote"] = sell_quote, buy_quote
+        pair_quotes.append(pair)
+    return pair_quotes, skipped_results
+
+def evaluate_directions(pair_quotes):
+    """
+    Computes spend, received, profit and margin of both trade directions for all pairs at once
+    with NumPy float64 arrays. Returns one row per pair and direction, in the order of pair_quotes.
+    """
+    n_pairs = len(pair_quotes)
+    results_df = pd.DataFrame([quotes["result"] for quotes in pair_quotes])
+    results_df = results_df.loc[np.repeat(np.arange(n_pairs), 2)].reset_index(drop=True)
+
+    # Even rows: "Buy on Binance, Sell on Uniswap" (sell quote), odd rows: "Buy on Uniswap, Sell on Binance" (buy quote)
+    is_buy_on_binance = np.tile([True, False], n_pairs)
+    binance_price = np.array([[q["binance_ask"], q["binance_bid"]] for q in pair_quotes], dtype=np.float64).ravel()
+    uniswap_quotes = np.array(
+        [[q["sell_quote"], q["buy_quote"]] for q in pair_quotes], dtype=np.float64
+    ).reshape(-1, 4)
+    uniswap_amount, new_price, actual_price, gas_eth = uniswap_quotes.T
+    eth_price_in_quote = np.repeat(np.array([q["eth_price_in_quote"] for q in pair_quotes], dtype=np.float64), 2)
+    trade_amount_base = results_df["trade_amount_base"].to_numpy()
+    base_stablecoin_price = results_df["base_stablecoin_price"].to_numpy()
+
+    binance_amount_quote = trade_amount_base * binance_price
+    spend = np.where(is_buy_on_binance, binance_amount_quote * (1 + config.BINANCE_FEE), uniswap_amount)
+    received = np.where(is_buy_on_binance, uniswap_amount, binance_amount_quote * (1 - config.BINANCE_FEE))
+    gas_fee_quote = gas_eth * eth_price_in_quote
+    profit = received - spend - gas_fee_quote
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin = np.where(spend > 0, profit / spend, 0.0)
+        profit_stablecoin = np.where(binance_price > 0, profit / binance_price * base_stablecoin_price, 0.0)
+
+    # Columns in the order of DIRECTION_COLUMNS
+    results_df["decision"] = np.tile(DIRECTIONS, n_pairs)
+    results_df["binance_actual_price"] = binance_price
+    results_df["uniswap_actual_price"] = actual_price
+    results_df["amount_in_quote"] = spend
+    results_df["amount_out_quote"] = received
+    results_df["uniswap_new_price"] = new_price
+    results_df["gas_fee_eth"] = gas_eth
+    results_df["gas_fee_quote"] = gas_fee_quote
+    results_df["profit"] = profit
+    results_df["margin"] = margin
+    results_df["profit_stablecoin"] = profit_stablecoin
+    return results_df
+
+def run_arbitrage_cycle(exchange, w3, multicall, abis, trade_amount_usd, results_output, block_watcher=None, ticker_stream=None):
+    """
+    Main arbitrage cycle to find and evaluate opportunities.
+    Returns the best margin of the cycle, or None if no pair could be evaluated.
+    """
     logging.info("Starting new Binance-Uniswap arbitrage cycle. Press Ctrl+C to stop.")
 
     try:
-        pairs_df = pd.read_csv(CSV_INPUT)
+        pairs_df, pair_rows = load_pairs(CSV_INPUT)
         if pairs_df.empty:
             logging.critical(f"{CSV_INPUT} is empty. Skipping cycle.")
             return
-        
-        exchange = ccxt.binance()
-        exchange.load_markets()
-        w3 = Web3(Web3.HTTPProvider(config.ETHEREUM_RPC_URL))
+
+        market_symbols = refresh_markets(exchange)
         if not w3.is_connected():
             raise ConnectionError("Failed to connect to Ethereum RPC")
-        abis = load_abis()
+        # One request for every monitored pair and every conversion price instead of round-trips per pair
+        binance_pairs = tuple(pairs_df["binance_pair"].unique())
+        conversion_symbols = get_conversion_symbols(market_symbols, binance_pairs)
+        symbols = list(set(binance_pairs) | conversion_symbols)
+        tickers = None
+        if ticker_stream:
+            ticker_stream.watch({exchange.market_id(symbol): symbol for symbol in symbols})
+            tickers = ticker_stream.get_tickers(symbols)
+        if tickers is None: # No stream, or it is still connecting / stale
+            tickers = exchange.fetch_tickers(symbols)
+        # The ETH price is shared by every pair with the same quote currency, so resolve it once per cycle
+        eth_prices = {
+            quote_symbol: get_eth_price_in_currency(tickers, quote_symbol)
+            for quote_symbol in pairs_df["quote_symbol"].unique()
+        }
     except Exception as e:
         logging.critical(f"Setup failed: {e}. Skipping cycle.")
         return
 
-    results = []
-
     logging.info(f"Processing {len(pairs_df)} pairs from {CSV_INPUT}...")
+    warm_pool_cache(w3, multicall, pairs_df["uniswap_pool_id"], abis)
+    if config.MIN_POOL_TVL_USD > 0:
+        refresh_pool_reserves(multicall, pairs_df["uniswap_pool_id"])
+
+    prepared_pairs = [
+        pair for pair in (
+            prepare_pair(index, len(pairs_df), row, w3, abis, tickers, eth_prices, trade_amount_usd)
+            for index, row in enumerate(pair_rows)
+        ) if pair is not None
+    ]
+    # All slot0 and quote reads of the cycle travel in a few Multicall3 requests instead of ~4 RPCs per pair
+    try:
+        pair_quotes, skipped_results = fetch_uniswap_quotes(w3, multicall, prepared_pairs, block_watcher) if prepared_pairs else ([], [])
+    except Exception as e:
+        logging.critical(f"Fetching Uniswap quotes failed: {e}. Skipping cycle.")
+        return
 
-    for index, row in pairs_df.iterrows():
-        binance_pair = row["binance_pair"]
-        uniswap_pool_id = row["uniswap_pool_id"]
-        # reverse_price: False -> Binance price: QUOTE/BASE, Uniswap pool's price: token1/token0 (token0=BASE, token1=QUOTE)
-        #                True  -> Binance price: QUOTE/BASE, Uniswap reversed price: token0/token1 (token0=QUOTE, token1=BASE)
-        reverse_price_on_uniswap = bool(row["reverse_price"])
-        base_symbol, quote_symbol = binance_pair.split('/')
-
-        logging.info(f"({index+1}/{len(pairs_df)}) Processing: {binance_pair}, Uniswap pool: {uniswap_pool_id}")
-
-        try:
-            uniswap_pool = UniswapPoolHelper(w3, uniswap_pool_id, abis)
-            uniswap_base_token = uniswap_pool.token0 if not reverse_price_on_uniswap else uniswap_pool.token1
-
-            binance_mid_price = get_binance_mid_price(exchange, binance_pair)
-            base_stablecoin_price, stablecoin_symbol = get_base_price_in_stablecoin(exchange, base_symbol, quote_symbol, binance_mid_price)
-
-            if not base_stablecoin_price:
-                logging.warning(f"Could not find stablecoin price for {base_symbol}. Skipping.")
-                continue
-
-            trade_amount_base = trade_amount_usd / base_stablecoin_price
-
-            with ThreadPoolExecutor() as executor:
-                fut_ticker = executor.submit(exchange.fetch_ticker, binance_pair)
-                fut_sell = executor.submit(uniswap_pool.get_sell_quote, uniswap_base_token, trade_amount_base)
-                fut_buy = executor.submit(uniswap_pool.get_buy_quote, uniswap_base_token, trade_amount_base)
-
-                ticker = fut_ticker.result(timeout=5)
-                binance_ask, binance_bid = Decimal(str(ticker['ask'])), Decimal(str(ticker['bid']))
-                uniswap_sell_quote = fut_sell.result(timeout=5)
-                uniswap_buy_quote = fut_buy.result(timeout=5)
-
-            base_result_data = {
-                "blocknumber": w3.eth.block_number,
-                "timestamp": int(time.time()),
-                "binance_pair": binance_pair,
-                "uniswap_pair": row["uniswap_pair"],
-                "uniswap_pool_id": uniswap_pool_id,
-                "reverse_price": int(reverse_price_on_uniswap),
-                "base_symbol": base_symbol, "quote_symbol": quote_symbol,
-                "uniswap_fee": float(uniswap_pool.fee) / 1e6,
-                "binance_fee": config.BINANCE_FEE,
-                "binance_mid_price": float(binance_mid_price),
-                "uniswap_mid_price": float(get_uniswap_mid_price(uniswap_pool, reverse_price_on_uniswap)),
-                "trade_amount_base": float(trade_amount_base),
-                "base_stablecoin_price": float(base_stablecoin_price),
-                "stablecoin_symbol": stablecoin_symbol
-            }
-
-            # Evaluate both trade directions
-            for direction, binance_price, uniswap_quote in [
-                ("Buy on Binance, Sell on Uniswap", binance_ask, uniswap_sell_quote),
-                ("Buy on Uniswap, Sell on Binance", binance_bid, uniswap_buy_quote)
-            ]:
-                amount_out, new_price, actual_price, gas_eth = uniswap_quote
-                
-                if "Buy on Binance" in direction:
-                    spend = trade_amount_base * binance_price * Decimal(str(1 + config.BINANCE_FEE))
-                    received = amount_out
-                else: # Buy on Uniswap
-                    spend = amount_out
-                    received = trade_amount_base * binance_price * Decimal(str(1 - config.BINANCE_FEE))
-
-                gas_fee_quote = gas_eth * get_eth_price_in_currency(exchange, quote_symbol)
-                profit = received - spend - gas_fee_quote
-                margin = profit / spend if spend > 0 else Decimal(0)
-                profit_stablecoin = profit / binance_price * base_stablecoin_price if binance_price > 0 else Decimal(0)
-
-                results.append(base_result_data | {
-                    "decision": direction, "binance_actual_price": float(binance_price),
-                    "uniswap_actual_price": float(actual_price), "amount_in_quote": float(spend),
-                    "amount_out_quote": float(received), "uniswap_new_price": float(new_price),
-                    "gas_fee_eth": float(gas_eth), "gas_fee_quote": float(gas_fee_quote),
-                    "profit": float(profit), "margin": float(margin),
-                    "profit_stablecoin": float(profit_stablecoin)
-                })
-
-                logging.info(f"\t{direction}: Margin={margin:.4%}, Profit={profit_stablecoin:.4f} {stablecoin_symbol}")
-
-                if profit > 0 and margin > config.PROFIT_THRESHOLD:
-                    handle_arbitrage_opportunity(direction, binance_pair, profit_stablecoin, stablecoin_symbol, margin, uniswap_pool, abis)
-
-        except Exception as e:
-            logging.error(f"Failed processing {binance_pair}: {e}", exc_info=False)
-            continue
-    
-    if results:
-        results_df = pd.DataFrame(results)
-        header = not os.path.exists(csv_output)
-        results_df.to_csv(csv_output, index=False, float_format='%.10f', mode='a', header=header)
-        logging.info(f"Saved {len(results_df)} results to {csv_output}")
+    best_margin = None
+    results_df = evaluate_directions(pair_quotes) if pair_quotes else None
+    if results_df is not None:
+        for row_index, result in enumerate(results_df.itertuples(index=False)):
+            # Lazy %-formatting: the per-row message is only built if INFO is enabled
+            logging.info("\t%s %s: Margin=%.4f%%, Profit=%.4f %s", result.binance_pair, result.decision,
+                         result.margin * 100, result.profit_stablecoin, result.stablecoin_symbol)
+
+            if result.profit > 0 and result.margin > config.PROFIT_THRESHOLD:
+                handle_arbitrage_opportunity(result.decision, result.binance_pair, result.profit_stablecoin,
+                                             result.stablecoin_symbol, result.margin, pair_quotes[row_index // 2]["pool"], abis)
+        best_margin = float(results_df["margin"].max())
+
+    if skipped_results:
+        # One row per pruned pair, with its mid prices, so the pair still appears in the results
+        logging.info(f"Skipped quoting {len(skipped_results)} pairs whose mid spread is below the fees")
+        skipped_df = pd.DataFrame(skipped_results).reindex(columns=[*skipped_results[0], *DIRECTION_COLUMNS])
+        skipped_df["decision"] = SKIPPED_DECISION
+        results_df = skipped_df if results_df is None else pd.concat([results_df, skipped_df], ignore_index=True)
+
+    if results_df is not None:
+        save_results(results_df, results_output)
+        logging.info(f"Saved {len(results_df)} results to {results_output}")
+    return best_margin
+
+def get_cycle_sleep(recent_margins):
+    """
+    Returns the pause before the next cycle: shorter while recent margins approach PROFIT_THRESHOLD,
+    since profitable windows close quickly, and longer while the markets are quiet.
+    """
+    if not recent_margins:
+        return CYCLE_SLEEP
+    # Margins are usually negative after fees, so the pause follows the distance to the threshold
+    margin_gap = max(config.PROFIT_THRESHOLD - max(recent_margins), 0.0)
+    sleep_seconds = CYCLE_SLEEP * margin_gap / MARGIN_GAP_SCALE
+    return round(float(np.clip(sleep_seconds, MIN_CYCLE_SLEEP, MAX_CYCLE_SLEEP)), 1)
+
+def save_results(results_df, results_output):
+    """Appends the results of a cycle to the CSV file or Parquet dataset at results_output."""
+    if config.RESULTS_FORMAT == "parquet":
+        # Every call adds a new file to the dataset directory; read it back with pd.read_parquet(results_output)
+        pq.write_to_dataset(pa.Table.from_pandas(results_df, preserve_index=False), root_path=results_output,
+                            compression="zstd")
+    else:
+        results_file = _results_files.get(results_output)
+        if results_file is None:
+            results_file = _results_files[results_output] = open(results_output, 'a', newline='', buffering=1 << 16)
+        # An append handle starts at the end of the file, so the header is written only into a new or empty file
+        results_df.to_csv(results_file, index=False, float_format='%.10f', header=results_file.tell() == 0)
+        results_file.flush()
 
 def handle_arbitrage_opportunity(direction, pair, profit, stablecoin, margin, pool, abis):
     """Logs, notifies, and executes a trade for an arbitrage opportunity."""
@@ -265,23 +784,54 @@ def main():
         logging.error("Invalid trade amount. Exiting.")
         return
 
-    csv_output = f"arbitrage_results_{trade_amount_usd}.csv"
+    results_output = f"arbitrage_results_{trade_amount_usd}"
+    if config.RESULTS_FORMAT != "parquet":
+        results_output += ".csv"
     logging.info(f"Bot starting with trade amount: ${trade_amount_usd:,.2f}")
     send_telegram_message(f"Arbitrage bot started. Trade Amount: ${trade_amount_usd:,.2f}")
 
-    while True:
-        try:
-            run_arbitrage_cycle(trade_amount_usd, csv_output)
-        except KeyboardInterrupt:
-            logging.info("Bot stopped by user.")
-            send_telegram_message("Arbitrage bot stopped by user.")
-            break
-        except Exception as e:
-            logging.critical(f"A critical error occurred in the main loop: {e}", exc_info=True)
-            send_telegram_message(f"Bot encountered a critical error: {e}")
+    try:
+        abis = load_abis()
+    except Exception as e:
+        logging.critical(f"Failed to load ABIs: {e}. Exiting.")
+        return
 
-        logging.info("Cycle finished. Waiting 10 seconds...")
-        time.sleep(10)
+    # The clients live for the whole run so connections and cached pool helpers are reused between cycles.
+    exchange = create_binance_exchange()
+    w3 = create_web3()
+    multicall = Multicall(w3, abis)
+    # Optional push-based block numbers; eth_calls keep using the HTTP provider
+    block_watcher = BlockWatcher(config.ETHEREUM_WS_URL).start() if config.ETHEREUM_WS_URL else None
+    # Optional in-memory Binance tickers; REST fetch_tickers remains the fallback
+    ticker_stream = BinanceTickerStream().start() if config.BINANCE_WS_TICKERS else None
+
+    recent_margins = deque(maxlen=MARGIN_HISTORY_CYCLES)
+    cycle_sleep = CYCLE_SLEEP
+    try:
+        while True:
+            try:
+                best_margin = run_arbitrage_cycle(exchange, w3, multicall, abis, float(trade_amount_usd), results_output, block_watcher, ticker_stream)
+            except KeyboardInterrupt:
+                logging.info("Bot stopped by user.")
+                send_telegram_message("Arbitrage bot stopped by user.")
+                break
+            except Exception as e:
+                logging.critical(f"A critical error occurred in the main loop: {e}", exc_info=True)
+                send_telegram_message(f"Bot encountered a critical error: {e}")
+            else:
+                if best_margin is not None:
+                    recent_margins.append(best_margin)
+
+            new_cycle_sleep = get_cycle_sleep(recent_margins)
+            if new_cycle_sleep != cycle_sleep:
+                logging.info(f"Adjusting cycle pause from {cycle_sleep:.1f}s to {new_cycle_sleep:.1f}s "
+                             f"(best recent margin: {max(recent_margins):.4%})")
+                cycle_sleep = new_cycle_sleep
+            logging.info(f"Cycle finished. Waiting {cycle_sleep:.1f} seconds...")
+            time.sleep(cycle_sleep)
+    finally:
+        # The RPC workers are shut down here only, however the loop ends
+        rpc_executor.shutdown(wait=True, cancel_futures=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import threading
+import time
+from web3 import AsyncWeb3, WebSocketProvider
+
+logger = logging.getLogger(__name__)
+
+class BlockWatcher:
+    def __init__(self, ws_url: str, reconnect_delay: float = 5.0, max_age: float = 30.0):
+        """
+        Keeps track of the latest block number through an eth_subscribe('newHeads') WebSocket feed,
+        so that the block number is pushed by the node instead of polled once per cycle.
+
+        Args:
+            ws_url (str): WebSocket URL of the Ethereum node.
+            reconnect_delay (float): Seconds to wait before reconnecting after the feed fails.
+            max_age (float): Seconds after which the latest head is considered stale. About two slots (12 s each),
+                so head jitter or a missed slot does not count as a stalled feed.
+        """
+        self.ws_url = ws_url
+        self.reconnect_delay = reconnect_delay
+        self.max_age = max_age
+        self._latest = None # (block number, monotonic arrival time); written by the watcher thread only
+        self._thread = threading.Thread(target=self._run, name="block-watcher", daemon=True)
+
+    def start(self):
+        """Starts the watcher thread. The feed reconnects on its own for the lifetime of the process."""
+        self._thread.start()
+        return self
+
+    def get_latest_block(self):
+        """
+        Returns the latest pushed block number, or None if no head arrived within max_age seconds
+        (e.g. a connection that stopped delivering heads without failing).
+        """
+        latest = self._latest
+        if latest is None or time.monotonic() - latest[1] > self.max_age:
+            return None
+        return latest[0]
+
+    def _run(self):
+        asyncio.run(self._watch())
+
+    async def _watch(self):
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(self.ws_url)) as w3:
+                    await w3.eth.subscribe("newHeads")
+                    logger.info(f"BlockWatcher: Subscribed to new heads at {self.ws_url}")
+                    async for message in w3.socket.process_subscriptions():
+                        self._latest = (message["result"]["number"], time.monotonic())
+            except Exception as e:
+                logger.warning(f"BlockWatcher: New heads feed failed: {e}. Reconnecting in {self.reconnect_delay}s.")
+            # The last known block is stale until the feed is back
+            self._latest = None
+            await asyncio.sleep(self.reconnect_delay)
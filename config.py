@@ -14,11 +14,18 @@ load_dotenv()
 config = SimpleNamespace(
     PROFIT_THRESHOLD=float(os.getenv("PROFIT_THRESHOLD", "0.0001")),       # 0.01%
     BINANCE_FEE=float(os.getenv("BINANCE_FEE", "0.00017250")),            # 0.01725%
+    MIN_POOL_TVL_USD=float(os.getenv("MIN_POOL_TVL_USD", "0")),          # 0 disables the filter
+    SKIP_QUOTES_BELOW_FEES=os.getenv("SKIP_QUOTES_BELOW_FEES", "false").lower() == "true", # Prune pairs by mid spread
+    LOCAL_QUOTES=os.getenv("LOCAL_QUOTES", "false").lower() == "true",   # Compute in-range quotes without the quoter
+    RESULTS_FORMAT=os.getenv("RESULTS_FORMAT", "csv").lower(),           # "csv" or "parquet"
+    BINANCE_WS_TICKERS=os.getenv("BINANCE_WS_TICKERS", "false").lower() == "true", # Stream tickers instead of polling REST
     ETHEREUM_RPC_URL=os.getenv("ETHEREUM_RPC_URL", "https://ethereum-rpc.publicnode.com"),
+    ETHEREUM_WS_URL=os.getenv("ETHEREUM_WS_URL", ""),                    # Optional, e.g. wss://ethereum-rpc.publicnode.com
     UNISWAP_SUBGRAPH_ID="5zvR82QoaXYFyDEKLZ9t6v9adgnptxYpKpSbxtgVENFV",
     QUOTER_ADDRESS="0x61fFE014bA17989E743c5F6cB21bF9697530B21e", # UniswapV3QuoterV2 Mainnet Address
     QUOTER_ADDRESS_SEPOLIA="0xEd1f6473345F45b75F8179591dd5bA1888cf2FB3",  # UniswapV3QuoterV2 Sepolia Address
     ROUTER_ADDRESS_SEPOLIA="0x3bFA4769FB09eefC5a80d6E87c3B9C650f7Ae48E", # SwapRouter02 Sepolia Address
+    MULTICALL3_ADDRESS="0xcA11bde05977b3631167028862bE2a173976CA11", # Multicall3, same address on Mainnet and Sepolia
     TELEGRAM_TOKEN=os.getenv("TELEGRAM_TOKEN", ""),
     TELEGRAM_CHAT_ID=os.getenv("TELEGRAM_CHAT_ID", ""),
 
@@ -47,6 +54,7 @@ ABI_PATHS = {
     "POOL": ABI_DIR / "UniswapV3Pool.json",
     "ERC20": ABI_DIR / "Erc20.json",
     "ROUTER": ABI_DIR / "UniswapV3RouterV2.json",
+    "MULTICALL": ABI_DIR / "Multicall3.json",
 }
 
 # ======== Load ABI Function ========
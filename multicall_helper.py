@@ -0,0 +1,81 @@
+from web3 import Web3
+from eth_utils.abi import (
+    function_abi_to_4byte_selector,
+    get_abi_output_types,
+    get_aligned_abi_inputs,
+    get_normalized_abi_inputs,
+)
+from config import config
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Multicall:
+    def __init__(self, w3: Web3, abis: dict, multicall_address: str = None):
+        """
+        Initializes the Multicall helper.
+
+        Args:
+            w3: Web3 instance.
+            abis: Dictionary containing the ABIs.
+            multicall_address (str, optional): Address of the Multicall3 contract.
+                If not provided, uses config.MULTICALL3_ADDRESS.
+        """
+        self.w3 = w3
+        self.address = Web3.to_checksum_address(multicall_address or config.MULTICALL3_ADDRESS)
+        self.contract = self.w3.eth.contract(address=self.address, abi=abis['MULTICALL'])
+
+    def _encode_call(self, call) -> bytes:
+        """
+        Encodes the calldata of an unexecuted contract function call. Unlike the call's own
+        encoder, struct arguments may be given as dicts (as in the quoter params), like in .call().
+        """
+        normalized_args = get_normalized_abi_inputs(call.abi, *call.args, **call.kwargs)
+        argument_types, aligned_args = get_aligned_abi_inputs(call.abi, normalized_args)
+        return function_abi_to_4byte_selector(call.abi) + self.w3.codec.encode(argument_types, aligned_args)
+
+    def aggregate(self, calls: list, block_identifier='latest') -> list:
+        """
+        Executes many read-only contract calls in a single eth_call through Multicall3.aggregate3.
+        Every call is sent with allowFailure=True, so one reverting call (e.g. a quote on a pool
+        without liquidity) does not abort the others.
+
+        Args:
+            calls (list): Unexecuted contract function calls, e.g. pool_contract.functions.slot0().
+            block_identifier: Block at which all calls are executed. Default is 'latest'.
+
+        Returns:
+            list: One (success, result) tuple per call, in the order of calls.
+            - success (bool): False if the call reverted or its result could not be decoded.
+            - result: The decoded return value (a tuple of outputs), or None if success is False.
+        """
+        if not calls:
+            return []
+
+        # A call whose arguments cannot be encoded fails alone instead of failing the whole request
+        results = [(False, None)] * len(calls)
+        call3_params, sent_indices = [], []
+        for i, call in enumerate(calls):
+            try:
+                call3_params.append((call.address, True, self._encode_call(call)))
+                sent_indices.append(i)
+            except Exception as e:
+                logger.warning(f"Multicall aggregate: Cannot encode {call.fn_name} at {call.address}: {e}")
+        if not call3_params:
+            return results
+
+        try:
+            raw_results = self.contract.functions.aggregate3(call3_params).call(block_identifier=block_identifier)
+        except Exception as e:
+            logger.error(f"Multicall aggregate: Error executing {len(call3_params)} calls: {e}")
+            raise
+
+        for i, (success, return_data) in zip(sent_indices, raw_results):
+            if not success:
+                continue
+            call = calls[i]
+            try:
+                results[i] = (True, self.w3.codec.decode(get_abi_output_types(call.abi), return_data))
+            except Exception as e:
+                logger.warning(f"Multicall aggregate: Cannot decode result of {call.fn_name} at {call.address}: {e}")
+        return results
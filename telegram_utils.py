@@ -1,17 +1,53 @@
 import requests
 import logging
+import queue
+import threading
+import time
+import atexit
+from requests.adapters import HTTPAdapter
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# ---- Persistent HTTP session ----
+# Reused across messages so every notification after the first skips the TCP+TLS handshake.
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Built once; None when Telegram is not configured
+_TG_URL = f"https://api.telegram.org/bot{config.TELEGRAM_TOKEN}/sendMessage" if config.TELEGRAM_TOKEN else None
+
+# ---- Background sender ----
+# Messages are posted by a daemon thread so callers never block on the Telegram API.
+_TG_QUEUE_SIZE = 100 # Messages beyond this backlog are dropped
+_TG_QUEUE = queue.Queue(maxsize=_TG_QUEUE_SIZE)
+
+def _tg_worker():
+    while True:
+        url, payload = _TG_QUEUE.get()
+        try:
+            _TG_SESSION.post(url, data=payload, timeout=5)
+        except Exception as e:
+            logger.warning(f"Failed to send Telegram message: {e}")
+        finally:
+            _TG_QUEUE.task_done()
+
+threading.Thread(target=_tg_worker, name="telegram-sender", daemon=True).start()
+
+@atexit.register
+def _flush_telegram_queue(timeout: float = 5.0):
+    """Gives queued messages (e.g. the stop notification) a few seconds to be sent at exit."""
+    deadline = time.monotonic() + timeout
+    while _TG_QUEUE.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
 # ---- Telegram Notification ----
 def send_telegram_message(message: str):
     if not config.TELEGRAM_TOKEN or not config.TELEGRAM_CHAT_ID:
         logger.warning("Telegram token or chat ID not set. Skipping Telegram notification.")
         return
-    url = f"https://api.telegram.org/bot{config.TELEGRAM_TOKEN}/sendMessage"
     payload = {"chat_id": config.TELEGRAM_CHAT_ID, "text": message, "parse_mode": "Markdown"}
     try:
-        requests.post(url, data=payload, timeout=5)
-    except Exception as e:
-        logger.warning(f"Failed to send Telegram message: {e}")
\ No newline at end of file
+        _TG_QUEUE.put_nowait((_TG_URL, payload))
+    except queue.Full:
+        logger.warning("Telegram queue is full. Dropping message.")
@@ -1,12 +1,94 @@
 from web3 import Web3
 from decimal import Decimal
+from functools import cached_property
 from config import config
 import logging
+import math
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+_Q192 = 1 << 192 # Fixed-point scale of sqrtPriceX96 squared
+_WEI_PER_ETH = Decimal(10) ** 18
+
+# ---- Local swap math ----
+# Integer port of Uniswap V3's SwapMath.computeSwapStep for a swap that stays within the active
+# liquidity range. Python ints are arbitrary precision, so the Q64.96 math maps 1:1 to the contracts.
+FEE_TICK_SPACINGS = {100: 1, 500: 10, 3000: 60, 10000: 200} # Fee tier (pips) -> tick spacing
+_FEE_DENOMINATOR = 10**6
+_LOG_TICK_BASE = math.log(1.0001)
+_TICK_MARGIN = 0.01 # Swaps ending closer than this (in ticks) to a boundary are left to the quoter
+
+def _div_round_up(a: int, b: int) -> int:
+    return -(-a // b)
+
+def _swap_exact_input(sqrt_price_x96: int, liquidity: int, amount_in: int, fee: int, zero_for_one: bool):
+    """Returns (amount_out, sqrt_price_x96_after) of an exact input swap, or None if the pool has no liquidity."""
+    if liquidity <= 0:
+        return None
+    amount_in_less_fee = amount_in * (_FEE_DENOMINATOR - fee) // _FEE_DENOMINATOR
+    liquidity_x96 = liquidity << 96
+    if zero_for_one:
+        sqrt_price_after = _div_round_up(liquidity_x96 * sqrt_price_x96, liquidity_x96 + amount_in_less_fee * sqrt_price_x96)
+        amount_out = liquidity * (sqrt_price_x96 - sqrt_price_after) >> 96
+    else:
+        sqrt_price_after = sqrt_price_x96 + (amount_in_less_fee << 96) // liquidity
+        amount_out = liquidity_x96 * (sqrt_price_after - sqrt_price_x96) // sqrt_price_after // sqrt_price_x96
+    return amount_out, sqrt_price_after
+
+def _swap_exact_output(sqrt_price_x96: int, liquidity: int, amount_out: int, fee: int, zero_for_one: bool):
+    """Returns (amount_in, sqrt_price_x96_after) of an exact output swap, or None if the range cannot provide amount_out."""
+    if liquidity <= 0:
+        return None
+    liquidity_x96 = liquidity << 96
+    if zero_for_one:
+        sqrt_price_after = sqrt_price_x96 - _div_round_up(amount_out << 96, liquidity)
+        if sqrt_price_after <= 0:
+            return None
+        amount_in = _div_round_up(
+            _div_round_up(liquidity_x96 * (sqrt_price_x96 - sqrt_price_after), sqrt_price_x96), sqrt_price_after
+        )
+    else:
+        denominator = liquidity_x96 - amount_out * sqrt_price_x96
+        if denominator <= 0:
+            return None
+        sqrt_price_after = _div_round_up(liquidity_x96 * sqrt_price_x96, denominator)
+        amount_in = _div_round_up(liquidity * (sqrt_price_after - sqrt_price_x96), 2**96)
+    amount_in += _div_round_up(amount_in * fee, _FEE_DENOMINATOR - fee)
+    return amount_in, sqrt_price_after
+
+# ---- Gas price cache ----
+# The gas price changes at most once per block, so quotes share one reading per GAS_PRICE_TTL seconds.
+GAS_PRICE_TTL = 2.0
+_gas_price_cache = {} # id(w3) -> (fetched_at, gas_price_wei)
+_gas_price_lock = threading.Lock()
+
+def get_cached_gas_price(w3: Web3) -> int:
+    """Returns w3.eth.gas_price, fetching it at most once per GAS_PRICE_TTL seconds per Web3 instance."""
+    with _gas_price_lock:
+        cached = _gas_price_cache.get(id(w3))
+        if cached and time.monotonic() - cached[0] < GAS_PRICE_TTL:
+            return cached[1]
+        gas_price_wei = w3.eth.gas_price
+        _gas_price_cache[id(w3)] = (time.monotonic(), gas_price_wei)
+        return gas_price_wei
+
+# ---- Contract factories ----
+# Building a contract class walks the whole ABI, so each ABI gets one class per Web3 instance
+# and every contract after the first is only bound to its address (about twice as fast).
+_contract_factories = {} # (id(w3), id(abi)) -> contract class; the class keeps w3 and abi alive, so the ids stay unique
+
+def get_contract(w3: Web3, address: str, abi: list):
+    """Returns a contract at address, built from the shared contract class of abi."""
+    key = (id(w3), id(abi))
+    factory = _contract_factories.get(key)
+    if factory is None:
+        factory = _contract_factories.setdefault(key, w3.eth.contract(abi=abi))
+    return factory(address=address)
+
 class Token:
-    def __init__(self, w3: Web3, address: str, erc20_abi: list):
+    def __init__(self, w3: Web3, address: str, erc20_abi: list, decimals: int = None, symbol: str = None):
         """
         Initializes a Token object.
 
@@ -14,16 +96,60 @@ class Token:
             w3: Web3 instance.
             address: The token's contract address.
             erc20_abi: The ABI for an ERC20 token.
+            decimals (int, optional): The token's decimals, if already known. Read from the chain otherwise.
+            symbol (str, optional): The token's symbol, if already known. Read from the chain otherwise.
         """
         self.w3 = w3
         self.address = Web3.to_checksum_address(address)
-        self.contract = self.w3.eth.contract(address=self.address, abi=erc20_abi)
-        self.decimals = self.contract.functions.decimals().call()
-        self.symbol = self.contract.functions.symbol().call()
+        self.contract = get_contract(self.w3, self.address, erc20_abi)
+        self.decimals = decimals if decimals is not None else self.contract.functions.decimals().call()
+        self.symbol = symbol if symbol is not None else self.contract.functions.symbol().call()
+        self.scale = Decimal(10) ** self.decimals # Base units per whole token
+
+# ---- Approval cache ----
+# The router is approved for the maximum amount, which swaps never exhaust in practice,
+# so once an allowance is that high it is not read again before every trade.
+_UNLIMITED_ALLOWANCE = 2**255
+_unlimited_approvals = set() # (token address, owner, spender)
+
+# ---- Token cache ----
+# Decimals and symbol never change, so each token is read once per run and shared by all pools.
+_token_cache = {} # (id(w3), checksum address) -> Token; a cached Token keeps its w3 alive, so the id stays unique
+
+def get_token(w3: Web3, address: str, erc20_abi: list, decimals: int = None, symbol: str = None) -> Token:
+    """Returns the cached Token at address, creating it (see Token) only on first use per Web3 instance."""
+    key = (id(w3), Web3.to_checksum_address(address))
+    token = _token_cache.get(key)
+    if token is None:
+        token = _token_cache.setdefault(key, Token(w3, address, erc20_abi, decimals=decimals, symbol=symbol))
+    return token
+
+def get_tokens(w3: Web3, addresses: list, erc20_abi: list) -> list:
+    """
+    Returns the cached Tokens at addresses, reading decimals and symbol of the uncached ones
+    in a single batch request instead of two calls per token.
+    """
+    missing = list(dict.fromkeys(
+        Web3.to_checksum_address(address) for address in addresses if get_cached_token(w3, address) is None
+    ))
+    if missing:
+        contracts = [get_contract(w3, address, erc20_abi) for address in missing]
+        with w3.batch_requests() as batch:
+            for contract in contracts:
+                batch.add(contract.functions.decimals())
+                batch.add(contract.functions.symbol())
+            results = batch.execute()
+        for i, address in enumerate(missing):
+            get_token(w3, address, erc20_abi, decimals=results[2 * i], symbol=results[2 * i + 1])
+    return [get_cached_token(w3, address) for address in addresses]
+
+def get_cached_token(w3: Web3, address: str):
+    """Returns the cached Token at address, or None if it has not been created yet."""
+    return _token_cache.get((id(w3), Web3.to_checksum_address(address)))
 
 
 class UniswapPoolHelper:
-    def __init__(self, w3: Web3, pool_address: str, abis: dict):
+    def __init__(self, w3: Web3, pool_address: str, abis: dict, token0: Token = None, token1: Token = None, fee: int = None):
         """
         Initializes the UniswapPoolHelper for a specific pool.
 
@@ -31,6 +157,8 @@ class UniswapPoolHelper:
             w3: Web3 instance.
             pool_address: Address of the Uniswap V3 pool.
             abis: Dictionary containing the ABIs.
+            token0, token1, fee (optional): The pool's tokens and fee, if already read (e.g. in a batch).
+                Read from the chain otherwise.
         """
         self.w3 = w3
         self.pool_address_cs = Web3.to_checksum_address(pool_address)
@@ -40,36 +168,61 @@ class UniswapPoolHelper:
         self.quoter_abi = abis['QUOTER']
         self.erc20_abi = abis['ERC20']
         self.router_abi = abis['ROUTER']
+        self._quoter_contracts = {} # quoter address -> bound quoter contract
+        self._router_contracts = {} # router address -> bound router contract
+        self._gas_estimates = {} # 'sell' / 'buy' -> gas estimate of the last quote, reused by local quotes
+        self.reserves = None # (reserve0, reserve1), set by update_reserves
+        self.reserves_read_at = None # time.monotonic() of the last update_reserves
 
         try:
-            self.pool_contract = self.w3.eth.contract(address=self.pool_address_cs, abi=self.pool_abi)
-
-            # Create Token objects for token0 and token1
-            token0_address = self.pool_contract.functions.token0().call()
-            self.token0 = Token(self.w3, token0_address, self.erc20_abi)
-
-            token1_address = self.pool_contract.functions.token1().call()
-            self.token1 = Token(self.w3, token1_address, self.erc20_abi)
-
-            self.fee = self.pool_contract.functions.fee().call()
+            self.pool_contract = get_contract(self.w3, self.pool_address_cs, self.pool_abi)
+
+            # Metadata that was not passed in is read in one batch request (plus one for uncached tokens)
+            if token0 is None or token1 is None or fee is None:
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.pool_contract.functions.token0())
+                    batch.add(self.pool_contract.functions.token1())
+                    batch.add(self.pool_contract.functions.fee())
+                    token0_address, token1_address, pool_fee = batch.execute()
+                tokens = get_tokens(self.w3, [token0_address, token1_address], self.erc20_abi)
+                token0 = token0 or tokens[0]
+                token1 = token1 or tokens[1]
+                fee = fee if fee is not None else pool_fee
+            self.token0 = token0
+            self.token1 = token1
+            self.fee = fee
 
         except Exception as e:
             logger.error(f"UniswapPoolHelper __init__: Error initializing pool helper for {pool_address}: {e}")
             raise 
 
+    @cached_property
+    def chain_id(self) -> int:
+        """Chain id of the pool's network, read once on first access (e.g. to sign transactions)."""
+        return self.w3.eth.chain_id
+
+    @cached_property
+    def tick_spacing(self) -> int:
+        """Tick spacing of the pool, derived from the fee tier or read from the chain once for other tiers."""
+        tick_spacing = FEE_TICK_SPACINGS.get(self.fee)
+        if tick_spacing is None:
+            tick_spacing = self.pool_contract.functions.tickSpacing().call()
+        return tick_spacing
+
     @staticmethod
     def _calculate_price_from_sqrtprice(
-        sqrt_price_x96: Decimal,
+        sqrt_price_x96: int,
         decimals_t0: int,
         decimals_t1: int
     ) -> Decimal:
         """
         Calculates readable price of token0 in terms of token1.
         Result is: amount of token1 per one unit of token0.
+        The ratio is built exactly with integers, so only the final division is rounded.
         """
-        price_raw_t1_per_t0 = (sqrt_price_x96 / Decimal(2**96)) ** 2
-        adjusted_price = price_raw_t1_per_t0 * (Decimal(10) ** (decimals_t0 - decimals_t1))
-        return adjusted_price
+        numerator = sqrt_price_x96 * sqrt_price_x96 * 10 ** decimals_t0
+        denominator = _Q192 * 10 ** decimals_t1
+        return Decimal(numerator) / Decimal(denominator)
 
     def get_current_price(self, reverse_price: bool = False) -> Decimal:
         """
@@ -85,21 +238,25 @@ class UniswapPoolHelper:
         """
         try:
             slot0 = self.pool_contract.functions.slot0().call()
-            sqrt_price_x96 = Decimal(str(slot0[0]))
-            
-            # Calculate price of token0 in terms of token1
-            price = UniswapPoolHelper._calculate_price_from_sqrtprice(
-                sqrt_price_x96,
-                self.token0.decimals,
-                self.token1.decimals
-            )
-
-            if not reverse_price: return price
-            else: return Decimal(1) / price
+            return self.price_from_slot0(slot0, reverse_price)
         except Exception as e:
             logger.error(f"UniswapPoolHelper get_current_price: Error getting current price for pool {self.pool_address_cs}: {e}")
             raise
 
+    def price_from_slot0(self, slot0, reverse_price: bool = False) -> Decimal:
+        """Converts a raw slot0 result (e.g. read in a batch) into the readable price returned by get_current_price."""
+        sqrt_price_x96 = slot0[0]
+
+        # Calculate price of token0 in terms of token1
+        price = UniswapPoolHelper._calculate_price_from_sqrtprice(
+            sqrt_price_x96,
+            self.token0.decimals,
+            self.token1.decimals
+        )
+
+        if not reverse_price: return price
+        else: return Decimal(1) / price
+
     def get_sell_quote(self, token_in: Token, amount_in: Decimal, quoter_address: str = None):
         """
         Calculates a Uniswap V3 quote for selling an exact amount of an input token.
@@ -119,41 +276,8 @@ class UniswapPoolHelper:
             - gas_fee_eth (Decimal): Estimated gas fee in ETH for the transaction.
         """
         try:
-            token_out, is_token_in_token0 = self.resolve_token_out(token_in)
-            amount_in_base_units = int(amount_in * (Decimal(10) ** token_in.decimals))
-
-            quoter_address_cs = Web3.to_checksum_address(quoter_address or config.QUOTER_ADDRESS)
-            quoter_contract = self.w3.eth.contract(address=quoter_address_cs, abi=self.quoter_abi)
-
-            quote_params = {
-                'tokenIn': token_in.address,
-                'tokenOut': token_out.address,
-                'fee': self.fee,
-                'amountIn': amount_in_base_units,
-                'sqrtPriceLimitX96': 0
-            }
-            quote_result = quoter_contract.functions.quoteExactInputSingle(quote_params).call()
-
-            amount_out_base_units = Decimal(str(quote_result[0]))
-            sqrt_price_x96_after_swap = Decimal(str(quote_result[1]))
-            gas_estimate = Decimal(str(quote_result[3]))
-
-            amount_out = amount_out_base_units / (Decimal(10) ** token_out.decimals)
-
-            # Price after swap: token_out / token_in
-            price_after_swap = UniswapPoolHelper._calculate_price_from_sqrtprice(
-                sqrt_price_x96_after_swap,
-                self.token0.decimals,
-                self.token1.decimals
-            ) # price of token1 in terms of token0 (token1/token0)
-            
-            new_price = price_after_swap if is_token_in_token0 else (Decimal(1) / price_after_swap)
-            actual_price = (amount_out / amount_in) if amount_in != Decimal(0) else Decimal(0)
-
-            current_gas_price_wei = Decimal(str(self.w3.eth.gas_price))
-            gas_fee_eth = gas_estimate * current_gas_price_wei / (Decimal(10)**18)
-
-            return amount_out, new_price, actual_price, gas_fee_eth
+            quote_result = self._build_sell_quote_call(token_in, amount_in, quoter_address).call()
+            return self._parse_sell_quote(token_in, amount_in, quote_result, get_cached_gas_price(self.w3))
         except Exception as e:
             logger.error(f"UniswapPoolHelper get_sell_quote: Error getting sell quote for pool {self.pool_address_cs}: {e}")
             raise
@@ -177,43 +301,225 @@ class UniswapPoolHelper:
             - gas_fee_eth (Decimal): Estimated gas fee in ETH for the transaction.
         """
         try:
-            token_in, is_token_in_token0 = self.resolve_token_in(token_out)
-            amount_out_base_units = int(amount_out * (Decimal(10) ** token_out.decimals))
+            quote_result = self._build_buy_quote_call(token_out, amount_out, quoter_address).call()
+            return self._parse_buy_quote(token_out, amount_out, quote_result, get_cached_gas_price(self.w3))
+        except Exception as e:
+            logger.error(f"UniswapPoolHelper get_buy_quote: Error getting buy quote for pool {self.pool_address_cs}: {e}")
+            raise
 
-            quoter_address_cs = Web3.to_checksum_address(quoter_address or config.QUOTER_ADDRESS)
-            quoter_contract = self.w3.eth.contract(address=quoter_address_cs, abi=self.quoter_abi)
-            
-            quote_params = {
-                'tokenIn': token_in.address,
-                'tokenOut': token_out.address,
-                'fee': self.fee,
-                'amount': amount_out_base_units,
-                'sqrtPriceLimitX96': 0
-            }
-            quote_result = quoter_contract.functions.quoteExactOutputSingle(quote_params).call()
+    def get_reserve_calls(self) -> list:
+        """
+        Builds the unexecuted balanceOf calls of the pool's token0 and token1, the reserves update_reserves stores.
 
-            amount_in_base_units = Decimal(str(quote_result[0]))
-            sqrt_price_x96_after_swap = Decimal(str(quote_result[1]))
-            gas_estimate = Decimal(str(quote_result[3]))
+        Returns:
+            list: [balance0_call, balance1_call]
+        """
+        return [
+            self.token0.contract.functions.balanceOf(self.pool_address_cs),
+            self.token1.contract.functions.balanceOf(self.pool_address_cs)
+        ]
 
-            amount_in = amount_in_base_units / (Decimal(10) ** token_in.decimals)
+    def update_reserves(self, balance0: int, balance1: int):
+        """
+        Stores the token balances held by the pool from raw balanceOf results (e.g. read in a batch).
+        Used as a coarse depth (TVL) filter, so a snapshot refreshed every few minutes is accurate enough.
+        """
+        self.reserves = (Decimal(balance0) / self.token0.scale, Decimal(balance1) / self.token1.scale)
+        self.reserves_read_at = time.monotonic()
 
-            price_after_swap = UniswapPoolHelper._calculate_price_from_sqrtprice(
-                sqrt_price_x96_after_swap,
-                self.token0.decimals,
-                self.token1.decimals
-            )
-            
-            new_price = (Decimal(1) / price_after_swap) if is_token_in_token0 else price_after_swap
-            actual_price = (amount_in / amount_out) if amount_out != Decimal(0) else Decimal(0)
+    def get_quote_calls(self, token: Token, amount: Decimal, quoter_address: str = None) -> list:
+        """
+        Builds the unexecuted slot0, sell quote and buy quote calls for the same token and amount,
+        so that they can be aggregated with the calls of other pools (e.g. in one Multicall3 request).
+        Decode their results with parse_quote_results.
 
-            current_gas_price_wei = Decimal(str(self.w3.eth.gas_price))
-            gas_fee_eth = gas_estimate * current_gas_price_wei / (Decimal(10)**18)
-            
-            return amount_in, new_price, actual_price, gas_fee_eth
-        except Exception as e:
-            logger.error(f"UniswapPoolHelper get_buy_quote: Error getting buy quote for pool {self.pool_address_cs}: {e}")
-            raise
+        Args:
+            token (Token): The token sold in the sell quote and bought in the buy quote.
+            amount (Decimal): The human-readable amount of token to sell / buy.
+            quoter_address (str, optional): Address of the Uniswap V3 quoter contract.
+                If not provided, uses the QuoterV2 Mainnet.
+
+        Returns:
+            list: [slot0_call, sell_quote_call, buy_quote_call]
+        """
+        return [
+            self.pool_contract.functions.slot0(),
+            self._build_sell_quote_call(token, amount, quoter_address),
+            self._build_buy_quote_call(token, amount, quoter_address)
+        ]
+
+    def parse_quote_results(self, token: Token, amount: Decimal, results: list, gas_price_wei: int, reverse_price: bool = False):
+        """
+        Converts the raw results of the calls built by get_quote_calls.
+
+        Args:
+            token (Token): The token passed to get_quote_calls.
+            amount (Decimal): The amount passed to get_quote_calls.
+            results (list): The raw results of [slot0_call, sell_quote_call, buy_quote_call].
+            gas_price_wei (int): Gas price used to estimate the gas fees of the quotes.
+            reverse_price (bool): Same as in get_current_price.
+
+        Returns:
+            tuple: (current_price, sell_quote, buy_quote)
+            - current_price (Decimal): Same as the return value of get_current_price.
+            - sell_quote (tuple): Same as the return value of get_sell_quote.
+            - buy_quote (tuple): Same as the return value of get_buy_quote.
+        """
+        slot0_result, sell_result, buy_result = results
+        current_price = self.price_from_slot0(slot0_result, reverse_price)
+        sell_quote = self._parse_sell_quote(token, amount, sell_result, gas_price_wei)
+        buy_quote = self._parse_buy_quote(token, amount, buy_result, gas_price_wei)
+        return current_price, sell_quote, buy_quote
+
+    def get_state_calls(self) -> list:
+        """
+        Builds the unexecuted slot0 and liquidity calls, the pool state local_quote_results quotes from.
+
+        Returns:
+            list: [slot0_call, liquidity_call]
+        """
+        return [self.pool_contract.functions.slot0(), self.pool_contract.functions.liquidity()]
+
+    def local_quote_results(self, token: Token, amount: Decimal, state_results: list):
+        """
+        Computes the sell and buy quotes of get_quote_calls locally from the pool state, without the quoter.
+        Only swaps that end inside the tick spacing interval of the current tick are computed: initialized
+        ticks are multiples of the tick spacing, so no liquidity can change along the way and the result
+        equals the quoter's. The gas estimates are those of the pool's last quoter quotes.
+
+        Args:
+            token (Token): The token sold in the sell quote and bought in the buy quote.
+            amount (Decimal): The human-readable amount of token to sell / buy.
+            state_results (list): The raw results of [slot0_call, liquidity_call] from get_state_calls.
+
+        Returns:
+            list: Raw results in the format of [slot0_call, sell_quote_call, buy_quote_call], to be passed
+            to parse_quote_results, or None if the quoter is needed (a swap may cross an initialized tick,
+            or the pool has not been quoted by the quoter yet).
+        """
+        if 'sell' not in self._gas_estimates or 'buy' not in self._gas_estimates:
+            return None
+        slot0_result, (liquidity,) = state_results
+        sqrt_price_x96, tick = slot0_result[0], slot0_result[1]
+        is_token0 = token.address == self.token0.address
+        amount_base_units = int(amount * token.scale)
+
+        # Sell: token in, the other token out. Buy: the other token in, token out.
+        sell_swap = _swap_exact_input(sqrt_price_x96, liquidity, amount_base_units, self.fee, zero_for_one=is_token0)
+        buy_swap = _swap_exact_output(sqrt_price_x96, liquidity, amount_base_units, self.fee, zero_for_one=not is_token0)
+        if sell_swap is None or buy_swap is None:
+            return None
+
+        lower_tick = tick // self.tick_spacing * self.tick_spacing
+        for _, sqrt_price_after in (sell_swap, buy_swap):
+            tick_after = 2 * math.log(sqrt_price_after / 2**96) / _LOG_TICK_BASE
+            if not lower_tick + _TICK_MARGIN < tick_after < lower_tick + self.tick_spacing - _TICK_MARGIN:
+                return None
+
+        # Same layout as the quoter's (amount, sqrtPriceX96After, initializedTicksCrossed, gasEstimate)
+        sell_result = (sell_swap[0], sell_swap[1], 0, self._gas_estimates['sell'])
+        buy_result = (buy_swap[0], buy_swap[1], 0, self._gas_estimates['buy'])
+        return [slot0_result, sell_result, buy_result]
+
+    def _get_quoter_contract(self, quoter_address: str = None):
+        """Returns the quoter contract bound to quoter_address, binding it (and its ABI) only once per helper."""
+        quoter_address = quoter_address or config.QUOTER_ADDRESS
+        quoter_contract = self._quoter_contracts.get(quoter_address)
+        if quoter_contract is None:
+            quoter_address_cs = Web3.to_checksum_address(quoter_address)
+            quoter_contract = get_contract(self.w3, quoter_address_cs, self.quoter_abi)
+            self._quoter_contracts[quoter_address] = quoter_contract
+        return quoter_contract
+
+    def _get_router_contract(self, router_address_cs: str):
+        """Returns the router contract bound to router_address_cs, binding it (and its ABI) only once per helper."""
+        router_contract = self._router_contracts.get(router_address_cs)
+        if router_contract is None:
+            router_contract = get_contract(self.w3, router_address_cs, self.router_abi)
+            self._router_contracts[router_address_cs] = router_contract
+        return router_contract
+
+    def _build_sell_quote_call(self, token_in: Token, amount_in: Decimal, quoter_address: str = None):
+        """Builds the (not yet executed) quoteExactInputSingle call for selling amount_in of token_in."""
+        token_out, _ = self.resolve_token_out(token_in)
+        amount_in_base_units = int(amount_in * token_in.scale)
+
+        quoter_contract = self._get_quoter_contract(quoter_address)
+
+        quote_params = {
+            'tokenIn': token_in.address,
+            'tokenOut': token_out.address,
+            'fee': self.fee,
+            'amountIn': amount_in_base_units,
+            'sqrtPriceLimitX96': 0
+        }
+        return quoter_contract.functions.quoteExactInputSingle(quote_params)
+
+    def _build_buy_quote_call(self, token_out: Token, amount_out: Decimal, quoter_address: str = None):
+        """Builds the (not yet executed) quoteExactOutputSingle call for buying amount_out of token_out."""
+        token_in, _ = self.resolve_token_in(token_out)
+        amount_out_base_units = int(amount_out * token_out.scale)
+
+        quoter_contract = self._get_quoter_contract(quoter_address)
+
+        quote_params = {
+            'tokenIn': token_in.address,
+            'tokenOut': token_out.address,
+            'fee': self.fee,
+            'amount': amount_out_base_units,
+            'sqrtPriceLimitX96': 0
+        }
+        return quoter_contract.functions.quoteExactOutputSingle(quote_params)
+
+    def _parse_sell_quote(self, token_in: Token, amount_in: Decimal, quote_result, gas_price_wei: int):
+        """Converts a raw quoteExactInputSingle result into the tuple returned by get_sell_quote."""
+        token_out, is_token_in_token0 = self.resolve_token_out(token_in)
+
+        amount_out_base_units = Decimal(quote_result[0])
+        sqrt_price_x96_after_swap = quote_result[1]
+        gas_estimate = quote_result[3]
+        self._gas_estimates['sell'] = gas_estimate
+
+        amount_out = amount_out_base_units / token_out.scale
+
+        # Price after swap: token_out / token_in
+        price_after_swap = UniswapPoolHelper._calculate_price_from_sqrtprice(
+            sqrt_price_x96_after_swap,
+            self.token0.decimals,
+            self.token1.decimals
+        ) # price of token1 in terms of token0 (token1/token0)
+        
+        new_price = price_after_swap if is_token_in_token0 else (Decimal(1) / price_after_swap)
+        actual_price = (amount_out / amount_in) if amount_in != Decimal(0) else Decimal(0)
+
+        # The fee in wei is an exact int product, so only the conversion to ETH is a Decimal operation
+        gas_fee_eth = Decimal(gas_estimate * gas_price_wei) / _WEI_PER_ETH
+
+        return amount_out, new_price, actual_price, gas_fee_eth
+
+    def _parse_buy_quote(self, token_out: Token, amount_out: Decimal, quote_result, gas_price_wei: int):
+        """Converts a raw quoteExactOutputSingle result into the tuple returned by get_buy_quote."""
+        token_in, is_token_in_token0 = self.resolve_token_in(token_out)
+
+        amount_in_base_units = Decimal(quote_result[0])
+        sqrt_price_x96_after_swap = quote_result[1]
+        gas_estimate = quote_result[3]
+        self._gas_estimates['buy'] = gas_estimate
+
+        amount_in = amount_in_base_units / token_in.scale
+
+        price_after_swap = UniswapPoolHelper._calculate_price_from_sqrtprice(
+            sqrt_price_x96_after_swap,
+            self.token0.decimals,
+            self.token1.decimals
+        )
+        
+        new_price = (Decimal(1) / price_after_swap) if is_token_in_token0 else price_after_swap
+        actual_price = (amount_in / amount_out) if amount_out != Decimal(0) else Decimal(0)
+
+        gas_fee_eth = Decimal(gas_estimate * gas_price_wei) / _WEI_PER_ETH
+        
+        return amount_in, new_price, actual_price, gas_fee_eth
 
     def sell(
         self,
@@ -244,35 +550,30 @@ class UniswapPoolHelper:
             recipient_address_cs = Web3.to_checksum_address(recipient_address)
             quoter_address_cs = Web3.to_checksum_address(quoter_address or config.QUOTER_ADDRESS)
             router_address_cs = Web3.to_checksum_address(router_address or config.ROUTER_ADDRESS)
-            router_contract = self.w3.eth.contract(address=router_address_cs, abi=self.router_abi)
+            router_contract = self._get_router_contract(router_address_cs)
 
             token_out, _ = self.resolve_token_out(token_in)
-            amount_in_base_units = int(amount_in * (Decimal(10) ** token_in.decimals))
+            amount_in_base_units = int(amount_in * token_in.scale)
 
-            current_balance_base_units = token_in.contract.functions.balanceOf(recipient_address_cs).call()
+            # Gas price, nonce, balance, allowance and the quote are read in one batch request
+            gas_price_wei, nonce, current_balance_base_units, quote_result, allowance = self._read_trade_state(
+                token_in, recipient_address_cs, router_address_cs,
+                self._build_sell_quote_call(token_in, amount_in, quoter_address_cs)
+            )
             if current_balance_base_units < amount_in_base_units:
                 raise ValueError(f"Insufficient balance of {token_in.symbol}.")
+            expected_amount_out, _, _, _ = self._parse_sell_quote(token_in, amount_in, quote_result, gas_price_wei)
 
             # Approve spending if necessary
-            allowance = token_in.contract.functions.allowance(recipient_address_cs, router_address_cs).call()
-            if allowance < amount_in_base_units:
-                approve_tx = token_in.contract.functions.approve(router_address_cs, 2**256 - 1).build_transaction({
-                    'from': recipient_address_cs,
-                    'chainId': self.w3.eth.chain_id,
-                    'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(recipient_address_cs, 'pending')
-                })
-                signed_approve_tx = self.w3.eth.account.sign_transaction(approve_tx, private_key)
-                approve_tx_hash = self.w3.eth.send_raw_transaction(signed_approve_tx.raw_transaction)
-                approve_receipt = self.w3.eth.wait_for_transaction_receipt(approve_tx_hash)
-                if approve_receipt.status != 1:
-                    raise Exception(f"Approval transaction failed: 0x{approve_tx_hash.hex()}")
-                logger.info(f"Approval transaction confirmed. See: https://sepolia.etherscan.io/tx/0x{approve_tx_hash.hex()}")
-
-            expected_amount_out, _, _, _ = self.get_sell_quote(token_in, amount_in, quoter_address=quoter_address_cs)
+            if self._ensure_router_allowance(token_in, recipient_address_cs, router_address_cs, allowance,
+                                             amount_in_base_units, private_key, nonce, gas_price_wei):
+                # The approval took at least a block, so the swap gets the next nonce, a fresh gas price and quote
+                nonce += 1
+                gas_price_wei = get_cached_gas_price(self.w3)
+                expected_amount_out, _, _, _ = self.get_sell_quote(token_in, amount_in, quoter_address=quoter_address_cs)
+
             amount_out_min = expected_amount_out * (Decimal(1) - slippage)
-            amount_out_min_base_units = int(amount_out_min * (Decimal(10) ** token_out.decimals))
+            amount_out_min_base_units = int(amount_out_min * token_out.scale)
 
             params = {
                 'tokenIn': token_in.address,
@@ -284,13 +585,12 @@ class UniswapPoolHelper:
                 'sqrtPriceLimitX96': 0
             }
             
-            # A new nonce is required if an approval was just sent.
-            swap_nonce = self.w3.eth.get_transaction_count(recipient_address_cs, 'pending')
             swap_tx = router_contract.functions.exactInputSingle(params).build_transaction({
                 'from': recipient_address_cs,
+                'chainId': self.chain_id,
                 'gas': 300000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': swap_nonce
+                'gasPrice': gas_price_wei,
+                'nonce': nonce
             })
 
             signed_swap_tx = self.w3.eth.account.sign_transaction(swap_tx, private_key)
@@ -336,36 +636,37 @@ class UniswapPoolHelper:
             recipient_address_cs = Web3.to_checksum_address(recipient_address)
             quoter_address_cs = Web3.to_checksum_address(quoter_address or config.QUOTER_ADDRESS)
             router_address_cs = Web3.to_checksum_address(router_address or config.ROUTER_ADDRESS)
-            router_contract = self.w3.eth.contract(address=router_address_cs, abi=self.router_abi)
+            router_contract = self._get_router_contract(router_address_cs)
 
             token_in, _ = self.resolve_token_in(token_out)
-            amount_out_base_units = int(amount_out * (Decimal(10) ** token_out.decimals))
+            amount_out_base_units = int(amount_out * token_out.scale)
+
+            # Gas price, nonce, balance, allowance and the quote are read in one batch request
+            gas_price_wei, nonce, current_balance_base_units, quote_result, allowance = self._read_trade_state(
+                token_in, recipient_address_cs, router_address_cs,
+                self._build_buy_quote_call(token_out, amount_out, quoter_address_cs)
+            )
 
-            # Get quote to determine max input amount
-            amount_in_expected, _, _, _ = self.get_buy_quote(token_out, amount_out, quoter_address_cs)
+            # The quote determines the max input amount
+            amount_in_expected, _, _, _ = self._parse_buy_quote(token_out, amount_out, quote_result, gas_price_wei)
             amount_in_max = amount_in_expected * (Decimal(1) + slippage)
-            amount_in_max_base_units = int(amount_in_max * (Decimal(10) ** token_in.decimals))
+            amount_in_max_base_units = int(amount_in_max * token_in.scale)
 
-            current_balance_base_units = token_in.contract.functions.balanceOf(recipient_address_cs).call()
             if current_balance_base_units < amount_in_max_base_units:
                 raise ValueError(f"Insufficient balance of {token_in.symbol}.")
 
             # Approve spending if necessary
-            allowance = token_in.contract.functions.allowance(recipient_address_cs, router_address_cs).call()
-            if allowance < amount_in_max_base_units:
-                approve_tx = token_in.contract.functions.approve(router_address_cs, 2**256 - 1).build_transaction({
-                    'from': recipient_address_cs,
-                    'chainId': self.w3.eth.chain_id,
-                    'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(recipient_address_cs, 'pending')
-                })
-                signed_approve_tx = self.w3.eth.account.sign_transaction(approve_tx, private_key)
-                approve_tx_hash = self.w3.eth.send_raw_transaction(signed_approve_tx.raw_transaction)
-                approve_receipt = self.w3.eth.wait_for_transaction_receipt(approve_tx_hash)
-                if approve_receipt.status != 1: 
-                    raise Exception(f"Approval transaction failed: 0x{approve_tx_hash.hex()}")
-                logger.info(f"Approval transaction confirmed. See: https://sepolia.etherscan.io/tx/0x{approve_tx_hash.hex()}")
+            if self._ensure_router_allowance(token_in, recipient_address_cs, router_address_cs, allowance,
+                                             amount_in_max_base_units, private_key, nonce, gas_price_wei):
+                # The approval took at least a block, so the swap gets the next nonce, a fresh gas price and quote
+                nonce += 1
+                gas_price_wei = get_cached_gas_price(self.w3)
+                amount_in_expected, _, _, _ = self.get_buy_quote(token_out, amount_out, quoter_address=quoter_address_cs)
+                amount_in_max = amount_in_expected * (Decimal(1) + slippage)
+                amount_in_max_base_units = int(amount_in_max * token_in.scale)
+
+                if current_balance_base_units < amount_in_max_base_units:
+                    raise ValueError(f"Insufficient balance of {token_in.symbol}.")
 
             params = {
                 'tokenIn': token_in.address,
@@ -377,13 +678,12 @@ class UniswapPoolHelper:
                 'sqrtPriceLimitX96': 0
             }
 
-            # A new nonce is required if an approval was just sent.
-            swap_nonce = self.w3.eth.get_transaction_count(recipient_address_cs, 'pending')
             swap_tx = router_contract.functions.exactOutputSingle(params).build_transaction({
                 'from': recipient_address_cs,
+                'chainId': self.chain_id,
                 'gas': 300000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': swap_nonce
+                'gasPrice': gas_price_wei,
+                'nonce': nonce
             })
 
             signed_swap_tx = self.w3.eth.account.sign_transaction(swap_tx, private_key)
@@ -399,6 +699,77 @@ class UniswapPoolHelper:
             logger.error(f"UniswapPoolHelper buy: Error executing buy for pool {self.pool_address_cs}: {e}")
             raise
 
+    def _read_trade_state(self, token_in: Token, recipient_address_cs: str, router_address_cs: str, quote_call):
+        """
+        Reads what a trade needs before its first transaction in one JSON-RPC batch request.
+
+        Args:
+            token_in (Token): The token the trade spends.
+            recipient_address_cs (str): Checksum address sending the trade.
+            router_address_cs (str): Checksum address of the router spending token_in.
+            quote_call: The unexecuted quote call of the trade (see _build_sell_quote_call / _build_buy_quote_call).
+
+        Returns:
+            tuple: (gas_price_wei, nonce, balance_base_units, quote_result, allowance)
+            - nonce (int): The sender's pending transaction count.
+            - quote_result: The raw result of quote_call.
+            - allowance (int): The router's allowance, or None if it is already known to be unlimited.
+        """
+        read_allowance = (token_in.address, recipient_address_cs, router_address_cs) not in _unlimited_approvals
+        with self.w3.batch_requests() as batch:
+            batch.add(self.w3.eth.gas_price)
+            batch.add(self.w3.eth.get_transaction_count(recipient_address_cs, 'pending'))
+            batch.add(token_in.contract.functions.balanceOf(recipient_address_cs))
+            batch.add(quote_call)
+            if read_allowance:
+                batch.add(token_in.contract.functions.allowance(recipient_address_cs, router_address_cs))
+            results = batch.execute()
+        if not read_allowance:
+            results.append(None)
+        return tuple(results)
+
+    def _ensure_router_allowance(
+        self,
+        token_in: Token,
+        recipient_address_cs: str,
+        router_address_cs: str,
+        allowance: int,
+        amount_base_units: int,
+        private_key: str,
+        nonce: int,
+        gas_price_wei: int
+    ) -> bool:
+        """
+        Approves the router for the maximum amount of token_in if allowance does not cover amount_base_units,
+        and waits for the approval. Unlimited allowances are remembered, so they are read only once per run.
+
+        Returns:
+            bool: True if an approval transaction was sent (with nonce), False otherwise.
+        """
+        approval_key = (token_in.address, recipient_address_cs, router_address_cs)
+        if allowance is None: # Already known to be unlimited
+            return False
+        if allowance >= amount_base_units:
+            if allowance >= _UNLIMITED_ALLOWANCE:
+                _unlimited_approvals.add(approval_key)
+            return False
+
+        approve_tx = token_in.contract.functions.approve(router_address_cs, 2**256 - 1).build_transaction({
+            'from': recipient_address_cs,
+            'chainId': self.chain_id,
+            'gas': 100000,
+            'gasPrice': gas_price_wei,
+            'nonce': nonce
+        })
+        signed_approve_tx = self.w3.eth.account.sign_transaction(approve_tx, private_key)
+        approve_tx_hash = self.w3.eth.send_raw_transaction(signed_approve_tx.raw_transaction)
+        approve_receipt = self.w3.eth.wait_for_transaction_receipt(approve_tx_hash)
+        if approve_receipt.status != 1:
+            raise Exception(f"Approval transaction failed: 0x{approve_tx_hash.hex()}")
+        logger.info(f"Approval transaction confirmed. See: https://sepolia.etherscan.io/tx/0x{approve_tx_hash.hex()}")
+        _unlimited_approvals.add(approval_key)
+        return True
+
     def resolve_token_out(self, token_in: Token) -> tuple[Token, bool]:
         """
         Resolves the output token and determines if the input token is token0.